@@ -1,30 +1,52 @@
 import uuid
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic import AliasChoices, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class MQTTSettings(BaseSettings):
     broker: str = "dev-mqtt.hprobot.cloud"
     port: int = 1883
     client_id: str = f"smartFarmSub-{uuid.uuid4()}"
-    class Config:
-        env_prefix = "MQTT_"
+    worker_count: int = 8  # 명령 처리 워커 스레드 수 (같은 로봇의 메시지는 같은 워커에서 순서대로 처리)
+    worker_queue_size: int = 1000  # 워커별 대기 메시지 수 상한 (가득 차면 배터리는 버리고 그 외 명령은 대기)
+    worker_put_timeout: float = 5.0  # 큐가 가득 찼을 때 수신 스레드가 명령을 넣으려 기다리는 최대 시간 (초)
+
+    model_config = SettingsConfigDict(env_prefix="MQTT_", frozen=True)
 
 
 class RedisSettings(BaseSettings):
     host: str = "localhost"  # Docker 컨테이너명 (로컬 개발 시 환경변수로 "localhost" 오버라이드)
     port: int = 6379
     db: int = 0
+    # 커넥션 풀 최대 연결 수 (동기/비동기 풀 각각, REDIS_POOL_SIZE 또는 REDIS_MAX_CONNECTIONS)
+    max_connections: int = Field(
+        default=50, validation_alias=AliasChoices("REDIS_POOL_SIZE", "REDIS_MAX_CONNECTIONS")
+    )
+    pool_timeout: int = 5  # 풀의 연결이 모두 사용 중일 때 반납을 기다리는 최대 시간 (초)
+    health_check_interval: int = 30  # 유휴 연결 재사용 전 PING 확인 주기 (초)
+    state_publish_interval_ms: int = 0  # 로봇 상태 발행 병합 주기 (0이면 업데이트마다 바로 발행)
+    state_publish_max_batch: int = 100  # 병합 중인 채널이 이 개수에 도달하면 주기를 기다리지 않고 발행
+    state_stream_maxlen: int = 0  # 맵별 상태 Stream 최대 길이 (0이면 Stream 기록 안 함, Pub/Sub만 사용)
 
-    class Config:
-        env_prefix = "REDIS_"
+    model_config = SettingsConfigDict(env_prefix="REDIS_", frozen=True)
 
 
 class Settings(BaseSettings):
     app_name: str = "Robot Controller API"
     version: str = "1.0.0"
 
-    mqtt: MQTTSettings = MQTTSettings()
-    redis: RedisSettings = RedisSettings()
+    mqtt: MQTTSettings = Field(default_factory=MQTTSettings)
+    redis: RedisSettings = Field(default_factory=RedisSettings)
+
+    model_config = SettingsConfigDict(frozen=True)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 싱글톤 반환 (환경변수 파싱은 최초 1회만 수행)"""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -1,14 +1,53 @@
 """경로 계산 서비스 - BFS 기반 경로 탐색 및 MQTT 응답 전송"""
-import json
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 
-from app.domain.path.service import bfs, cut_path, format_path
-from app.util.mqtt.client import mqtt_service
-from app.domain.robot.robot_state_service import robot_state_service
+from app.domain.path.service import bfs, bidirectional_bfs, cut_path, filter_path, format_path
+from app.domain.robot.robot_status import RobotStatus
+from app.util.redis.client import redis_service
+from app.util.redis.init_data import get_node_graph
+from app.util.log import get_logger
+
+logger = get_logger("path")
+
+
+@lru_cache(maxsize=1024)
+def _path_plan_topic(map_name: str, robot_id: str) -> str:
+    """경로 응답 MQTT 토픽 (맵/로봇별로 한 번만 생성)"""
+    return f"{map_name}/{robot_id}/server/path_plan"
+
+
+def _path_payload(path_str: str) -> str:
+    """경로 응답 payload 생성 - json.dumps({"path": path_str})와 동일한 문자열
+
+    경로 문자열은 숫자, 방향 문자(l/r/u/d)와 구분자(/ ~ ! , -)로만 구성되므로 JSON 이스케이프가 필요 없습니다.
+    """
+    return '{"path": "' + path_str + '"}'
 
 
 class PathCalculationService:
     """경로 계산 및 MQTT 응답 전송 서비스"""
 
+    PATH_CACHE_SIZE = 1024  # 경로 계산 결과 LRU 캐시 크기
+
+    def __init__(self):
+        # {(map_name, start, end, robot_id, is_return, 노드 스냅샷 해시): (경로 문자열, 실제 도착 노드)}
+        self._path_cache: OrderedDict[tuple, tuple[str | None, int]] = OrderedDict()
+        self._path_cache_lock = threading.Lock()
+
+    @cached_property
+    def _mqtt(self):
+        """MQTT 서비스 (첫 사용 시 import - paho 로딩 지연)"""
+        from app.util.mqtt.client import mqtt_service
+        return mqtt_service
+
+    @cached_property
+    def _robot_state(self):
+        """로봇 상태 서비스 (첫 사용 시 import)"""
+        from app.domain.robot.robot_state_service import robot_state_service
+        return robot_state_service
+
     def calculate_and_send_path(
         self, map_name: str, robot_id: str, start_node: int, end_node: int, is_return: bool = False
     ) -> None:
@@ -21,7 +60,7 @@ class PathCalculationService:
             end_node: 목적지 노드
             is_return: 복귀 경로 여부
         """
-        path_str, actual_end = self._calculate_path(map_name, start_node, end_node, robot_id)
+        path_str, actual_end = self._calculate_path(map_name, start_node, end_node, robot_id, is_return)
         self._send_path_response(map_name, robot_id, start_node, end_node, path_str, actual_end, is_return)
 
     def _parse_path_nodes(self, path_str: str) -> list[int]:
@@ -31,18 +70,19 @@ class PathCalculationService:
         반환: [start, n1, n2, ..., end] 순서의 노드 ID 리스트
         """
         try:
-            left, right = path_str.split("!")
-            end_node = int(left.split("~")[1])
-            nodes = []
-            for segment in right.rstrip("/").split("/"):
-                if segment:
-                    nodes.append(int(segment.split(",")[0]))
+            left, sep, right = path_str.partition("!")
+            if not sep:
+                return []
+            end_node = int(left.partition("~")[2])
+            nodes = [int(segment.partition(",")[0]) for segment in right.split("/") if segment]
             nodes.append(end_node)
             return nodes
         except Exception:
             return []
 
-    def _calculate_path(self, map_name: str, start_node: int, end_node: int, robot_id: str) -> tuple[str | None, int]:
+    def _calculate_path(
+        self, map_name: str, start_node: int, end_node: int, robot_id: str, is_return: bool = False
+    ) -> tuple[str | None, int]:
         """BFS 경로 계산
 
         Args:
@@ -50,27 +90,76 @@ class PathCalculationService:
             start_node: 시작 노드
             end_node: 목적지 노드
             robot_id: 로봇 ID
+            is_return: 복귀 경로 여부 (True면 양방향 BFS 사용)
 
         Returns:
             (경로 문자열, 실제 도착 노드) 또는 (None, end_node) if no path
         """
-        path, directions = bfs(map_name, start_node, end_node)
-
-        if not path:
+        # 출발지 = 목적지면 보낼 경로가 없음 (BFS/노드 조회 생략)
+        if start_node == end_node:
             return None, end_node
 
-        path, directions = cut_path(map_name, path, directions, robot_id)
+        # 노드/인접 리스트/스냅샷 해시를 같은 스냅샷에서 한 번만 조회 (스냅샷 해시는 아래 경로 캐시 키로 사용)
+        nodes, adjacency, snapshot_hash = get_node_graph(map_name)
+
+        # 같은 맵 상태(연결/점유)에서 같은 요청이면 이전 계산 결과 재사용
+        cache_key = (map_name, start_node, end_node, robot_id, is_return, snapshot_hash)
+        with self._path_cache_lock:
+            cached = self._path_cache.get(cache_key)
+            if cached is not None:
+                self._path_cache.move_to_end(cache_key)
+                return cached
+
+        result = self._compute_path(map_name, start_node, end_node, robot_id, is_return, nodes, adjacency)
 
-        print(f"[Path] {path}")
+        with self._path_cache_lock:
+            self._path_cache[cache_key] = result
+            if len(self._path_cache) > self.PATH_CACHE_SIZE:
+                self._path_cache.popitem(last=False)
+        return result
+
+    def _compute_path(
+        self,
+        map_name: str,
+        start_node: int,
+        end_node: int,
+        robot_id: str,
+        is_return: bool,
+        nodes: dict,
+        adjacency: list[tuple],
+    ) -> tuple[str | None, int]:
+        """BFS + 경로 자르기 + 문자열 변환 (캐시 미스 시 호출)"""
+        if is_return:
+            path, directions = bidirectional_bfs(nodes, start_node, end_node)
+            if not path:
+                return None, end_node
+            path, directions = cut_path(map_name, path, directions, robot_id, nodes)
+        else:
+            # 점유 노드 자르기는 BFS 경로 복원 중에 함께 처리
+            path, directions = bfs(map_name, start_node, end_node, nodes, robot_id, adjacency)
+            if not path:
+                return None, end_node
+            path, directions = filter_path(path, directions)
+
+        logger.info("[Path] %s", path)
         if len(path) <= 1:
             return None, end_node
 
         actual_end = path[-1]
         path_str = format_path(actual_end, start_node, path, directions, end_node)
 
-        print(f"[Path] Formatted path: {path_str}")
+        logger.info("[Path] Formatted path: %s", path_str)
         return path_str, actual_end
 
+    def _path_fields(self, path_str: str, status: str, start_node: int, end_node: int) -> dict[str, str]:
+        """경로 응답 공통 Redis 필드 생성 (성공/차단 공통)"""
+        return {
+            "path": path_str,
+            "status": status,
+            "start_node": str(start_node),
+            "end_node": str(end_node),
+        }
+
     def _send_path_response(
         self,
         map_name: str,
@@ -82,67 +171,58 @@ class PathCalculationService:
         is_return: bool = False,
     ) -> None:
         """MQTT 경로 응답 전송 및 Redis 저장"""
-        from app.util.redis.client import redis_service
-
-        response_topic = f"{map_name}/{robot_id}/server/path_plan"
+        response_topic = _path_plan_topic(map_name, robot_id)
+        path_key = f"robot:path:{map_name}:{robot_id}"
+        path_type = "Return path" if is_return else "Path"
 
         if path_str is None:
             # 경로를 찾지 못했거나 차단된 경우
             no_path_str = f"{end_node}!/d~{start_node}"
-            response_payload = json.dumps({"path": no_path_str})
-            mqtt_service.publish(response_topic, response_payload)
+            self._mqtt.publish(response_topic, _path_payload(no_path_str))
 
             # Redis에 경로 저장 (실패 경로도 저장)
-            path_key = f"robot:path:{map_name}:{robot_id}"
-            redis_service.hset(path_key, "path", no_path_str)
-            redis_service.hset(path_key, "status", "blocked")
-            redis_service.hset(path_key, "start_node", str(start_node))
-            redis_service.hset(path_key, "end_node", str(end_node))
+            redis_service.hset_mapping(path_key, self._path_fields(no_path_str, "blocked", start_node, end_node))
 
-            if is_return:
-                print(f"[Path] Robot {robot_id}: Return path blocked or not found ({start_node} → {end_node})")
-            else:
-                print(f"[Path] Robot {robot_id}: Path blocked or not found ({start_node} → {end_node})")
+            logger.info(
+                "[Path] Robot %s: %s blocked or not found (%s → %s)", robot_id, path_type, start_node, end_node
+            )
             return
 
         # 정상 경로 응답
-        response_payload = json.dumps({"path": path_str})
-
-        if mqtt_service.publish(response_topic, response_payload):
-            # Redis에 경로 저장
-            path_key = f"robot:path:{map_name}:{robot_id}"
-            redis_service.hset(path_key, "path", path_str)
-            redis_service.hset(path_key, "status", "success")
-            redis_service.hset(path_key, "start_node", str(start_node))
-            redis_service.hset(path_key, "end_node", str(end_node))
-            redis_service.hset(path_key, "actual_end", str(actual_end))
-            redis_service.hset(path_key, "is_return", str(is_return))
+        if self._mqtt.publish(response_topic, _path_payload(path_str)):
+            # Redis에 경로 저장 (한 번의 HSET으로 모든 필드 기록)
+            fields = self._path_fields(path_str, "success", start_node, end_node)
+            fields["actual_end"] = str(actual_end)
+            fields["is_return"] = str(is_return)
 
             # 주행 검증용 노드 순서 저장
             path_nodes = self._parse_path_nodes(path_str)
             if path_nodes:
-                redis_service.hset(path_key, "path_nodes", ",".join(str(n) for n in path_nodes))
-                redis_service.hset(path_key, "path_index", "0")
+                fields["path_nodes"] = ",".join(str(n) for n in path_nodes)
+                fields["path_index"] = "0"
+
+            redis_service.hset_mapping(path_key, fields)
 
-            print(f"[Path] Robot {robot_id}: Path saved to Redis (key: {path_key})")
+            logger.info("[Path] Robot %s: Path saved to Redis (key: %s)", robot_id, path_key)
 
             # 상태 변경 로직
             status_msg = ""
             if is_return:
-                # 복귀 경로인 경우 "return"으로 변경
-                robot_state_service.update_status(map_name, robot_id, "return")
-                status_msg = " - Status: return"
+                # 복귀 경로인 경우 RETURN으로 변경
+                self._robot_state.update_status(map_name, robot_id, RobotStatus.RETURN)
+                status_msg = f" - Status: {RobotStatus.RETURN.value}"
             elif start_node == 2:
-                # 2번 노드에서 출발하는 경우 "moving"으로 변경
-                robot_state_service.update_status(map_name, robot_id, "moving")
-                status_msg = " - Status: moving"
+                # 2번 노드에서 출발하는 경우 WORKING으로 변경
+                self._robot_state.update_status(map_name, robot_id, RobotStatus.WORKING)
+                status_msg = f" - Status: {RobotStatus.WORKING.value}"
 
-            path_type = "Return path" if is_return else "Path"
-            print(f"[Path] Robot {robot_id}: {path_type} sent ({start_node} → {actual_end}){status_msg}")
+            logger.info(
+                "[Path] Robot %s: %s sent (%s → %s)%s", robot_id, path_type, start_node, actual_end, status_msg
+            )
             if actual_end != end_node:
-                print(f"       Path cut at node {actual_end} (original destination: {end_node})")
+                logger.info("       Path cut at node %s (original destination: %s)", actual_end, end_node)
         else:
-            print(f"[Path] Robot {robot_id}: Failed to send path (MQTT not connected)")
+            logger.warning("[Path] Robot %s: Failed to send path (MQTT not connected)", robot_id)
 
 
 # 싱글톤 인스턴스
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Depends
 
 from app.config.settings import settings
@@ -9,9 +11,9 @@ from app.domain.path.models import (
     NodeOccupationResponse,
     OccupiedNodesResponse,
 )
-from app.domain.path.service import bfs, cut_path, format_path
-from app.util.mqtt.client import mqtt_service
+from app.domain.path.service import bfs, filter_path, format_path
 from app.util.redis.init_data import (
+    get_node_graph,
     occupy_node,
     release_node,
     get_occupied_nodes,
@@ -25,15 +27,20 @@ router = APIRouter(prefix="/path", tags=["path"])
 @router.post("", response_model=PathResponse)
 async def find_path(request: PathRequest):
     """BFS로 경로를 찾고 MQTT로 전송 (Redis 노드 데이터 기반, 맵별)"""
-    # 1. BFS로 전체 최단 경로 계산
-    path, directions = bfs(request.map_name, request.start, request.end)
+    # 1. BFS로 전체 최단 경로 계산 (노드 데이터는 한 번만 조회)
+    # Redis 조회는 블로킹이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    nodes, adjacency, _ = await asyncio.to_thread(get_node_graph, request.map_name)
+    # robot_id가 제공된 경우 BFS 경로 복원 중에 점유된 노드 직전에서 경로를 자름
+    path, directions = bfs(
+        request.map_name, request.start, request.end, nodes, request.robot_id, adjacency
+    )
 
     if not path:
         raise HTTPException(status_code=404, detail="경로를 찾을 수 없습니다")
 
-    # 2. robot_id가 제공된 경우, 점유된 노드를 고려하여 경로를 자름
+    # 2. robot_id가 제공된 경우, expected_node 제거 및 노드 수 제한
     if request.robot_id:
-        path, directions = cut_path(request.map_name, path, directions, request.robot_id)
+        path, directions = filter_path(path, directions)
 
         # 경로가 잘려서 시작 노드만 남은 경우
         if len(path) <= 1:
@@ -56,7 +63,7 @@ async def find_path(request: PathRequest):
 @router.post("/occupy", response_model=NodeOccupationResponse)
 async def occupy_node_endpoint(request: OccupyNodeRequest):
     """노드 점유 (맵별)"""
-    success = occupy_node(request.map_name, request.node_id, request.robot_id)
+    success = await asyncio.to_thread(occupy_node, request.map_name, request.node_id, request.robot_id)
 
     if success:
         return NodeOccupationResponse(
@@ -71,7 +78,7 @@ async def occupy_node_endpoint(request: OccupyNodeRequest):
 @router.post("/release", response_model=NodeOccupationResponse)
 async def release_node_endpoint(request: ReleaseNodeRequest):
     """노드 점유 해제 (맵별)"""
-    success = release_node(request.map_name, request.node_id, request.robot_id)
+    success = await asyncio.to_thread(release_node, request.map_name, request.node_id, request.robot_id)
 
     if success:
         return NodeOccupationResponse(
@@ -87,7 +94,7 @@ async def release_node_endpoint(request: ReleaseNodeRequest):
 @router.get("/occupied/{map_name}", response_model=OccupiedNodesResponse)
 async def get_occupied_nodes_endpoint(map_name: str = Depends(validate_map_name)):
     """점유된 노드 목록 조회 (맵별)"""
-    occupied = get_occupied_nodes(map_name)
+    occupied = await asyncio.to_thread(get_occupied_nodes, map_name)
     return OccupiedNodesResponse(occupied_nodes=occupied)
 
 
@@ -97,7 +104,7 @@ async def release_robot_nodes_endpoint(
     map_name: str = Depends(validate_map_name)
 ):
     """특정 로봇이 점유한 모든 노드 해제 (맵별)"""
-    count = release_robot_nodes(map_name, robot_id)
+    count = await asyncio.to_thread(release_robot_nodes, map_name, robot_id)
     return NodeOccupationResponse(
         success=True, message=f"맵 {map_name}에서 로봇 {robot_id}의 노드 {count}개 해제 완료"
     )
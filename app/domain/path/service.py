@@ -1,20 +1,32 @@
 from collections import deque
 
-from app.util.redis.init_data import get_all_nodes
+from app.util.redis.init_data import build_adjacency, get_all_nodes, get_node_graph
 
 
-def bfs(map_name: str, start: int, end: int) -> tuple[list[int], list[str]]:
+def bfs(
+    map_name: str,
+    start: int,
+    end: int,
+    nodes: dict | None = None,
+    robot_id: str | None = None,
+    adjacency: list[tuple] | None = None,
+) -> tuple[list[int], list[str]]:
     """BFS를 이용한 최단 경로 탐색 (Redis 노드 데이터 기반)
 
     Args:
         map_name: 맵 이름
         start: 시작 노드 ID
         end: 목적지 노드 ID
+        nodes: 미리 조회한 노드 데이터 (None이면 Redis에서 조회)
+        robot_id: 로봇 ID (지정 시 경로 복원 중 다른 로봇이 점유한 노드 직전에서 경로를 자름)
+        adjacency: nodes와 같은 스냅샷의 인접 리스트 (None이면 nodes로부터 생성)
 
     Returns:
         (경로 노드 리스트, 방향 리스트)
+        robot_id로 잘린 경우 방향 리스트는 cut_path와 같이 잘린 노드로 향하는 방향까지 포함
     """
-    nodes = get_all_nodes(map_name)
+    if nodes is None:
+        nodes, adjacency, _ = get_node_graph(map_name)
 
     if not nodes:
         return [], []
@@ -22,27 +34,166 @@ def bfs(map_name: str, start: int, end: int) -> tuple[list[int], list[str]]:
     if start not in nodes or end not in nodes:
         return [], []
 
-    queue = deque([(start, [start], [])])  # (현재 노드, 경로, 방향들)
-    visited = {start}
+    # 출발지 = 목적지면 탐색 없이 바로 반환
+    if start == end:
+        return [start], []
+
+    if adjacency is None:
+        adjacency = build_adjacency(nodes)
+
+    parent = _bfs_core(adjacency, start, end)
+    if parent is None:
+        return [], []
+
+    # 도착 노드에서 시작 노드까지 역추적하여 경로 복원
+    # 방향은 탐색 중 저장하지 않고 경로상의 간선에서만 역방향 맵으로 조회 (l, r, u, d 우선순위 동일)
+    path = [end]
+    directions = []
+    blocked = -1  # 역순 경로에서 다른 로봇이 점유한 노드 중 시작 노드에 가장 가까운 위치
+    cur = end
+    while cur != start:
+        prev = parent[cur]
+        if robot_id and nodes[cur].get("occupied") not in (None, robot_id):
+            blocked = len(path) - 1
+        directions.append(nodes[prev]["_dir"][cur])
+        path.append(prev)
+        cur = prev
+    path.reverse()
+    directions.reverse()
+
+    if blocked >= 0:
+        cut_index = len(path) - 1 - blocked
+        return path[:cut_index], directions[:cut_index]
+    return path, directions
 
-    while queue:
-        current, path, directions = queue.popleft()
 
+def _bfs_core(adjacency: list[tuple], start: int, end: int) -> list[int] | None:
+    """BFS 탐색 루프 (노드 ID 정수 연산만 사용)
+
+    Args:
+        adjacency: 노드 ID로 인덱싱되는 인접 리스트
+        start: 시작 노드 ID
+        end: 목적지 노드 ID
+
+    Returns:
+        parent[node_id] = 직전 노드 ID 리스트 (미방문은 -1), 도달할 수 없으면 None
+    """
+    parent = [-1] * len(adjacency)
+    parent[start] = start
+    queue = deque([start])
+
+    while queue:
+        current = queue.popleft()
         if current == end:
-            return path, directions
+            return parent
+
+        # 각 방향 탐색 (l, r, u, d - 맵에 없는 이웃은 인접 리스트에서 이미 제외됨)
+        for _, next_node in adjacency[current]:
+            if parent[next_node] < 0:
+                parent[next_node] = current
+                queue.append(next_node)
+
+    return None
+
+
+def bidirectional_bfs(nodes: dict, start: int, end: int) -> tuple[list[int], list[str]]:
+    """양방향 BFS 최단 경로 탐색 (복귀 경로처럼 목적지가 고정된 경우용)
+
+    시작/도착 양쪽에서 작은 프론티어부터 한 레벨씩 확장하여 만나는 지점에서 경로를 잇습니다.
+    맵은 단방향 연결이 있으므로 도착 쪽 탐색은 build_adjacency가 스냅샷마다 미리 만든
+    역방향 인접 리스트(node["_rev"])를 사용합니다.
+    최단 거리는 bfs와 같지만, 같은 길이의 경로가 여럿이면 만남 지점 기준으로 고르므로
+    bfs의 l, r, u, d 순서 경로와 다른 경로가 반환될 수 있습니다.
+
+    Args:
+        nodes: 노드 데이터 {node_id: node_data} (get_node_graph/build_adjacency 결과, _adj/_rev 포함)
+        start: 시작 노드 ID
+        end: 목적지 노드 ID
+
+    Returns:
+        (경로 노드 리스트, 방향 리스트)
+    """
+    if start not in nodes or end not in nodes:
+        return [], []
+
+    if start == end:
+        return [start], []
+
+    fwd_parent = {start: None}  # {노드: 직전 노드}
+    fwd_dir = {}  # {노드: 직전 노드에서 들어온 방향}
+    fwd_dist = {start: 0}
+    bwd_parent = {end: None}  # {노드: 다음 노드 (도착 방향)}
+    bwd_dir = {}  # {노드: 다음 노드로 나가는 방향}
+    bwd_dist = {end: 0}
+    fwd_frontier = [start]
+    bwd_frontier = [end]
+    meet = None
 
-        node = nodes[current]
+    while fwd_frontier and bwd_frontier and meet is None:
+        best = None
+        next_frontier = []
 
-        # 각 방향 탐색 (l, r, u, d)
-        for direction, next_node in [("l", node["l"]), ("r", node["r"]), ("u", node["u"]), ("d", node["d"])]:
-            if next_node != 0 and next_node not in visited and next_node in nodes:
-                visited.add(next_node)
-                queue.append((next_node, path + [next_node], directions + [direction]))
+        if len(fwd_frontier) <= len(bwd_frontier):
+            # 정방향 한 레벨 확장
+            for current in fwd_frontier:
+                for direction, next_node in nodes[current]["_adj"]:
+                    if next_node not in fwd_parent and next_node in nodes:
+                        fwd_parent[next_node] = current
+                        fwd_dir[next_node] = direction
+                        fwd_dist[next_node] = fwd_dist[current] + 1
+                        next_frontier.append(next_node)
+                        if next_node in bwd_dist:
+                            total = fwd_dist[next_node] + bwd_dist[next_node]
+                            if best is None or total < best[0]:
+                                best = (total, next_node)
+            fwd_frontier = next_frontier
+        else:
+            # 역방향 한 레벨 확장
+            for current in bwd_frontier:
+                for prev_node, direction in nodes[current]["_rev"]:
+                    if prev_node not in bwd_parent:
+                        bwd_parent[prev_node] = current
+                        bwd_dir[prev_node] = direction
+                        bwd_dist[prev_node] = bwd_dist[current] + 1
+                        next_frontier.append(prev_node)
+                        if prev_node in fwd_dist:
+                            total = fwd_dist[prev_node] + bwd_dist[prev_node]
+                            if best is None or total < best[0]:
+                                best = (total, prev_node)
+            bwd_frontier = next_frontier
+
+        # 레벨을 끝까지 확장한 뒤 가장 짧은 만남 지점을 선택
+        if best is not None:
+            meet = best[1]
+
+    if meet is None:
+        return [], []
 
-    return [], []
+    # 시작 → 만남 지점
+    path = []
+    directions = []
+    cur = meet
+    while cur is not None:
+        path.append(cur)
+        if fwd_parent[cur] is not None:
+            directions.append(fwd_dir[cur])
+        cur = fwd_parent[cur]
+    path.reverse()
+    directions.reverse()
 
+    # 만남 지점 → 도착
+    cur = meet
+    while bwd_parent[cur] is not None:
+        directions.append(bwd_dir[cur])
+        cur = bwd_parent[cur]
+        path.append(cur)
 
-def cut_path(map_name: str, path: list[int], directions: list[str], robot_id: str) -> tuple[list[int], list[str]]:
+    return path, directions
+
+
+def cut_path(
+    map_name: str, path: list[int], directions: list[str], robot_id: str, nodes: dict | None = None
+) -> tuple[list[int], list[str]]:
     """경로를 점유되지 않은 노드까지 자르기
 
     Args:
@@ -50,6 +201,7 @@ def cut_path(map_name: str, path: list[int], directions: list[str], robot_id: st
         path: 전체 경로 노드 리스트
         directions: 전체 방향 리스트
         robot_id: 로봇 ID
+        nodes: 미리 조회한 노드 데이터 (None이면 Redis에서 조회)
 
     Returns:
         (잘린 경로 노드 리스트, 잘린 방향 리스트)
@@ -57,7 +209,12 @@ def cut_path(map_name: str, path: list[int], directions: list[str], robot_id: st
     if not path:
         return [], []
 
-    nodes = get_all_nodes(map_name)
+    # 시작 노드만 있으면 자를 것이 없음 (노드 조회 생략)
+    if len(path) <= 1:
+        return path, directions
+
+    if nodes is None:
+        nodes = get_all_nodes(map_name)
     cut_index = len(path)  # 기본값: 전체 경로
 
     # 시작 노드(path[0])는 제외하고 경로 검사
@@ -76,11 +233,24 @@ def cut_path(map_name: str, path: list[int], directions: list[str], robot_id: st
             cut_index = i
             break
 
+    return filter_path(path[:cut_index], directions)
+
+
+def filter_path(path: list[int], directions: list[str]) -> tuple[list[int], list[str]]:
+    """expected_node를 제거하고 최대 20개 노드로 제한
+
+    Args:
+        path: 경로 노드 리스트 (점유 노드 기준으로 이미 잘린 경로)
+        directions: 방향 리스트
+
+    Returns:
+        (필터링된 경로 노드 리스트, 필터링된 방향 리스트)
+    """
     # expected_node 제거 (node % 3 == 0 or node % 3 == 2), real node만 유지 (node % 3 == 1)
     # 시작 노드(i==0)는 항상 유지
     filtered_path = []
     filtered_directions = []
-    for i, node in enumerate(path[:cut_index]):
+    for i, node in enumerate(path):
         if i == 0 or node % 3 == 1:
             filtered_path.append(node)
             if i < len(directions):
@@ -105,8 +275,7 @@ def format_path(end: int, start: int, path: list[int], directions: list[str], fi
         final_node: 원래 목적지 노드
     """
     final_direction = directions[-1]
-    result = f"{final_node}/{final_direction}~{end}!{start},{directions[0]}/"
+    parts = [f"{final_node}/{final_direction}~{end}!{start},{directions[0]}/"]
     # 마지막 목적지 노드 제외 (len(path) - 1)
-    for i in range(1, len(path) - 1):
-        result += f"{path[i]},{directions[i]}/"
-    return result
+    parts.extend(f"{path[i]},{directions[i]}/" for i in range(1, len(path) - 1))
+    return "".join(parts)
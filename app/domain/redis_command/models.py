@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class RedisCommandRequest(BaseModel):
+    """Redis 명령 요청 모델 - type, mapName, robotId만 필요
+
+    - 현재 노드: Redis에 저장된 로봇 상태에서 자동 조회
+    - 다음 노드: 현재 노드의 왼쪽(l) 방향 노드로 자동 결정
+    """
+    type: str  # "start", "return"
+    mapName: str  # 맵 이름
+    robotId: str  # 로봇 ID
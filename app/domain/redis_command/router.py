@@ -1,30 +1,25 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
 
+import orjson
+
+from app.domain.redis_command.models import RedisCommandRequest
 from app.util.redis.client import redis_service
-import json
 
 router = APIRouter(prefix="/redis", tags=["redis"])
 
 
-class RedisCommandRequest(BaseModel):
-    """Redis 명령 요청 모델 - type, mapName, robotId만 필요
-
-    - 현재 노드: Redis에 저장된 로봇 상태에서 자동 조회
-    - 다음 노드: 현재 노드의 왼쪽(l) 방향 노드로 자동 결정
-    """
-    type: str  # "start", "return"
-    mapName: str  # 맵 이름
-    robotId: str  # 로봇 ID
-
-
 @router.post("/publish")
-async def publish_command(request: RedisCommandRequest):
+async def publish_command(
+    request: RedisCommandRequest,
+    fire_and_forget: bool = Query(False, alias="async"),
+):
     """Redis 채널에 명령 발행 (단일 채널: robot:command)
 
     지원 명령: start, return
 
+    Query:
+    - async=1: Redis 응답을 기다리지 않고 발행을 예약한 뒤 바로 응답
+
     동작 방식:
     - start: 현재 노드의 왼쪽(l) 방향 노드를 MQTT server/button으로 전송
     - return: final_node: 0을 MQTT server/button으로 전송 (복귀 시그널)
@@ -48,14 +43,22 @@ async def publish_command(request: RedisCommandRequest):
       }
     """
     channel = "robot:command"
-    message = json.dumps(request.model_dump(exclude_none=True))
+    # 필드가 모두 필수라 model_dump 대신 직접 dict 구성
+    data = {"type": request.type, "mapName": request.mapName, "robotId": request.robotId}
+    # orjson은 bytes를 바로 반환하므로 Redis 클라이언트에서 다시 인코딩하지 않음
+    message = orjson.dumps(data)
+
+    if fire_and_forget:
+        published = redis_service.publish_nowait(channel, message)
+    else:
+        published = await redis_service.apublish(channel, message)
 
-    if redis_service.publish(channel, message):
+    if published:
         return {
             "success": True,
             "message": f"Command published to channel: {channel}",
             "channel": channel,
-            "data": request.model_dump(exclude_none=True)
+            "data": data
         }
     else:
         raise HTTPException(
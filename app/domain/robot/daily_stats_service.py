@@ -1,29 +1,126 @@
 """로봇 일일 운영 통계 서비스 - 4가지 상태별 시간 추적"""
+import logging
+import time
 from datetime import datetime, date, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from app.util.redis.client import redis_service
+from app.util.log import get_logger
 from app.domain.robot.robot_states import RobotOperationState
 
+logger = get_logger("daily_stats")
+
+
+STATS_TTL_SECONDS = 30 * 24 * 60 * 60  # 통계 키 만료 시간 (30일, 로봇이 더 이상 기록하지 않을 때 키 정리용)
+STATS_RETENTION_DAYS = 30  # 날짜별 통계 필드 보관 기간
+SECONDS_PER_DAY = 24 * 60 * 60.0
+# 통계 키 TTL 갱신 기준: 남은 TTL이 이 값보다 작을 때만 EXPIRE (하루 한 번 수준)
+STATS_TTL_REFRESH_BELOW = STATS_TTL_SECONDS - 24 * 60 * 60
+# 일일 통계 조회 시 읽는 가동률 상태 값 (조회 결과 순서)
+_STATS_STATE_VALUES = ("idle", "working", "full_charge_idle", "charging")
+
+# 상태 전환 Lua 스크립트 (이전 상태 조회 + 새 상태 기록 + 같은 날이면 누적까지 한 번의 왕복으로 원자 처리)
+# KEYS[1]: 현재 상태 키, KEYS[2]: 로봇 통계 키
+# ARGV[1]: 새 상태, ARGV[2]: 전환 시간(ISO), ARGV[3]: 전환 시간(epoch), ARGV[4]: 전환 날짜 00시(epoch), ARGV[5]: 통계 TTL,
+# ARGV[6]: 전환 날짜(YYYY-MM-DD, 통계 필드 prefix), ARGV[7]: TTL 갱신 기준 (남은 TTL이 이보다 작을 때만 EXPIRE)
+# 반환: {} (이전 상태 없음) | {이전 상태, 이전 started_at, 누적 여부(1/0), 누적 시간}
+#   누적 여부 0이면 날짜를 걸치거나 epoch 정보가 없는 경우로, Python에서 날짜별 분할 처리
+_START_STATE_LUA = """
+local prev = redis.call('HMGET', KEYS[1], 'state', 'started_at', 'started_at_ts')
+redis.call('HSET', KEYS[1], 'state', ARGV[1], 'started_at', ARGV[2], 'started_at_ts', ARGV[3])
+if not prev[1] or not prev[2] then
+    return {}
+end
+local started_ts = tonumber(prev[3])
+if started_ts and started_ts >= tonumber(ARGV[4]) then
+    local duration = tonumber(ARGV[3]) - started_ts
+    redis.call('HINCRBYFLOAT', KEYS[2], ARGV[6] .. ':' .. prev[1], duration)
+    if redis.call('TTL', KEYS[2]) < tonumber(ARGV[7]) then
+        redis.call('EXPIRE', KEYS[2], ARGV[5])
+    end
+    return {prev[1], prev[2], 1, tostring(duration)}
+end
+return {prev[1], prev[2], 0, '0'}
+"""
+
+
+# 이전 형식(날짜별 키 "robot:daily_stats:{맵}:{로봇}:{YYYY-MM-DD}") 통계를 로봇별 Hash로 옮기는 Lua 스크립트
+# 키 하나를 원자적으로 옮기고 바로 삭제하므로 여러 프로세스가 동시에 실행해도 중복 누적되지 않음
+# KEYS[1]: 이전 날짜별 통계 키, KEYS[2]: 로봇 통계 키
+# ARGV[1]: 날짜(YYYY-MM-DD, 통계 필드 prefix), ARGV[2]: 통계 TTL, ARGV[3]: TTL 갱신 기준
+# 반환: 옮긴 필드 개수 (이미 옮겨진 키면 0)
+_MIGRATE_LEGACY_STATS_LUA = """
+local legacy = redis.call('HGETALL', KEYS[1])
+for i = 1, #legacy, 2 do
+    redis.call('HINCRBYFLOAT', KEYS[2], ARGV[1] .. ':' .. legacy[i], legacy[i + 1])
+end
+redis.call('DEL', KEYS[1])
+if #legacy > 0 and redis.call('TTL', KEYS[2]) < tonumber(ARGV[3]) then
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+return #legacy / 2
+"""
+# 이전 형식 날짜별 통계 키 패턴 (새 형식 키 "robot:daily_stats:{맵}:{로봇}"과 겹치지 않도록 날짜 모양까지 지정)
+_LEGACY_STATS_KEY_PATTERN = "robot:daily_stats:*:*:????-??-??"
+
+
+@lru_cache(maxsize=1024)
+def _daily_stats_key(map_name: str, robot_id: str) -> str:
+    """로봇 통계 키 (맵/로봇별로 한 번만 생성)"""
+    return f"robot:daily_stats:{map_name}:{robot_id}"
+
+
+def _stats_field(target_date: date, state_value: str) -> str:
+    """통계 Hash 필드명 (예: "2024-01-27:working")"""
+    return f"{target_date.isoformat()}:{state_value}"
+
+
+@lru_cache(maxsize=1024)
+def _current_state_key(map_name: str, robot_id: str) -> str:
+    """현재 상태 추적 키 (맵/로봇별로 한 번만 생성)"""
+    return f"robot:current_state:{map_name}:{robot_id}"
+
+
+def _started_at_ts(current_state_data: dict) -> Optional[float]:
+    """현재 상태 시작 시각(epoch 초) 조회
+
+    started_at_ts가 없는 이전 형식 데이터만 ISO 문자열을 파싱합니다.
+    """
+    started_at_ts = current_state_data.get("started_at_ts")
+    if started_at_ts is not None:
+        return float(started_at_ts)
+    started_at = current_state_data.get("started_at")
+    if started_at is not None:
+        return datetime.fromisoformat(started_at).timestamp()
+    return None
+
 
 class DailyStatsService:
     """하루 단위로 로봇의 4가지 상태별 시간을 추적"""
 
-    def _get_daily_stats_key(self, map_name: str, robot_id: str, target_date: date = None) -> str:
-        """날짜별 통계 키 생성
+    def __init__(self):
+        self._start_state_script = None
+
+    def _get_start_state_script(self):
+        """상태 전환 Lua 스크립트 (Redis 연결 후 최초 사용 시 등록)"""
+        if self._start_state_script is None:
+            self._start_state_script = redis_service.register_script(_START_STATE_LUA)
+        return self._start_state_script
+
+    def _get_daily_stats_key(self, map_name: str, robot_id: str) -> str:
+        """로봇 통계 키 생성
+
+        날짜별 누적 시간은 하나의 Hash에 "{날짜}:{상태}" 필드로 저장합니다.
 
         Args:
             map_name: 맵 이름
             robot_id: 로봇 ID
-            target_date: 대상 날짜 (None이면 오늘)
 
         Returns:
-            Redis 키 (예: "robot:daily_stats:map1:robot1:2024-01-27")
+            Redis 키 (예: "robot:daily_stats:map1:robot1")
         """
-        if target_date is None:
-            target_date = date.today()
-        date_str = target_date.isoformat()
-        return f"robot:daily_stats:{map_name}:{robot_id}:{date_str}"
+        return _daily_stats_key(map_name, robot_id)
 
     def _get_current_state_key(self, map_name: str, robot_id: str) -> str:
         """현재 상태 추적 키 생성
@@ -35,7 +132,11 @@ class DailyStatsService:
         Returns:
             Redis 키 (예: "robot:current_state:map1:robot1")
         """
-        return f"robot:current_state:{map_name}:{robot_id}"
+        return _current_state_key(map_name, robot_id)
+
+    def current_state_key(self, map_name: str, robot_id: str) -> str:
+        """현재 상태 추적 키 (다른 서비스에서 파이프라인으로 함께 조회할 때 사용)"""
+        return self._get_current_state_key(map_name, robot_id)
 
     def start_state(
         self,
@@ -55,24 +156,88 @@ class DailyStatsService:
         if timestamp is None:
             timestamp = datetime.now()
 
-        current_state_key = self._get_current_state_key(map_name, robot_id)
+        script = self._get_start_state_script()
+        if script is None:
+            return
 
-        # 현재 상태 조회
-        current_state_data = redis_service.hgetall(current_state_key)
+        # 이전 상태 종료 + 새로운 상태 시작 (같은 날이면 누적까지 서버에서 처리)
+        result = script(**self._start_state_call(map_name, robot_id, new_state, timestamp))
+        self._finish_start_state(map_name, robot_id, new_state, timestamp, result)
 
-        # 이전 상태가 있으면 종료 처리
-        if current_state_data and "state" in current_state_data and "started_at" in current_state_data:
-            old_state = RobotOperationState(current_state_data["state"])
-            started_at = datetime.fromisoformat(current_state_data["started_at"])
+    def queue_start_state(
+        self,
+        pipe,
+        map_name: str,
+        robot_id: str,
+        new_state: RobotOperationState,
+        timestamp: datetime = None
+    ) -> Optional[Callable[[list], None]]:
+        """상태 전환을 다른 명령과 같은 파이프라인에 추가 (로봇 상태 저장과 한 번의 왕복으로 처리)
 
-            # 00시 경계를 기준으로 날짜별로 분할 처리
-            self._split_and_add_duration(map_name, robot_id, old_state, started_at, timestamp)
+        Args:
+            pipe: 상태 전환 스크립트를 추가할 파이프라인
+            map_name: 맵 이름
+            robot_id: 로봇 ID
+            new_state: 새로운 상태
+            timestamp: 상태 변경 시간 (None이면 현재 시간)
 
-        # 새로운 상태 시작
-        redis_service.hset(current_state_key, "state", new_state.value)
-        redis_service.hset(current_state_key, "started_at", timestamp.isoformat())
+        Returns:
+            파이프라인 실행 후 스크립트 결과로 호출할 마무리 함수 (미연결 시 None)
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        script = self._get_start_state_script()
+        if script is None:
+            return None
 
-        print(f"[DailyStats] Robot {robot_id}: {new_state.value} started")
+        script(client=pipe, **self._start_state_call(map_name, robot_id, new_state, timestamp))
+        return lambda result: self._finish_start_state(map_name, robot_id, new_state, timestamp, result)
+
+    def _start_state_call(
+        self,
+        map_name: str,
+        robot_id: str,
+        new_state: RobotOperationState,
+        timestamp: datetime
+    ) -> dict:
+        """상태 전환 Lua 스크립트의 keys/args"""
+        day_start = datetime.combine(timestamp.date(), datetime.min.time())
+        return {
+            "keys": [
+                self._get_current_state_key(map_name, robot_id),
+                self._get_daily_stats_key(map_name, robot_id),
+            ],
+            "args": [
+                new_state.value, timestamp.isoformat(), timestamp.timestamp(),
+                day_start.timestamp(), STATS_TTL_SECONDS, timestamp.date().isoformat(),
+                STATS_TTL_REFRESH_BELOW,
+            ],
+        }
+
+    def _finish_start_state(
+        self,
+        map_name: str,
+        robot_id: str,
+        new_state: RobotOperationState,
+        timestamp: datetime,
+        result: list
+    ) -> None:
+        """상태 전환 스크립트 결과 처리 (날짜를 걸친 이전 상태는 날짜별로 분할 누적)"""
+        if result:
+            old_state_value, started_at_str, accumulated, duration = result
+            if int(accumulated) == 1:
+                logger.debug(
+                    "[DailyStats] Robot %s: %s ended (duration: %.1fs on %s)",
+                    robot_id, old_state_value, float(duration), timestamp.date(),
+                )
+            else:
+                # 00시 경계를 기준으로 날짜별로 분할 처리
+                old_state = RobotOperationState(old_state_value)
+                started_at = datetime.fromisoformat(started_at_str)
+                self._split_and_add_duration(map_name, robot_id, old_state, started_at, timestamp)
+
+        logger.debug("[DailyStats] Robot %s: %s started", robot_id, new_state.value)
 
     def _split_and_add_duration(
         self,
@@ -101,64 +266,60 @@ class DailyStatsService:
         # 같은 날짜면 그냥 추가 (일반적인 경우)
         if start_date == end_date:
             duration = (ended_at - started_at).total_seconds()
-            self._add_duration(map_name, robot_id, state, duration, start_date)
-            print(f"[DailyStats] Robot {robot_id}: {state.value} ended (duration: {duration:.1f}s on {start_date})")
+            self._add_durations(map_name, robot_id, state, [(start_date, duration)])
+            logger.debug("[DailyStats] Robot %s: %s ended (duration: %.1fs on %s)", robot_id, state.value, duration, start_date)
             return
 
         # 날짜가 다르면 각 날짜별로 분할 (00시 초기화 실패 시 백업)
-        print(f"[DailyStats] WARNING: Robot {robot_id} state spans multiple days ({start_date} to {end_date}). Daily reset may have failed.")
-        current_date = start_date
-        current_time = started_at
-
-        while current_date <= end_date:
-            # 현재 날짜의 마지막 시간 (23:59:59.999999)
-            end_of_day = datetime.combine(current_date, datetime.max.time())
-
-            # 현재 구간의 종료 시간 결정
-            if current_date == end_date:
-                segment_end = ended_at
-            else:
-                segment_end = end_of_day
-
-            # 현재 날짜 구간의 시간 계산 및 저장
-            duration = (segment_end - current_time).total_seconds()
-            self._add_duration(map_name, robot_id, state, duration, current_date)
-            print(f"[DailyStats] Robot {robot_id}: {state.value} segment (duration: {duration:.1f}s on {current_date})")
-
-            # 다음 날짜로 이동
-            current_date = current_date + timedelta(days=1)
-            current_time = datetime.combine(current_date, datetime.min.time())
-
-    def _add_duration(
+        logger.warning(
+            "[DailyStats] Robot %s state spans multiple days (%s to %s). Daily reset may have failed.",
+            robot_id, start_date, end_date,
+        )
+
+        # 첫날(시작~다음날 00시), 중간 날(하루 전체), 마지막 날(00시~종료)로 계산
+        first_midnight = datetime.combine(start_date + timedelta(days=1), datetime.min.time())
+        last_midnight = datetime.combine(end_date, datetime.min.time())
+        full_days = (end_date - start_date).days - 1
+
+        segments = [(start_date, (first_midnight - started_at).total_seconds())]
+        segments.extend((start_date + timedelta(days=i), SECONDS_PER_DAY) for i in range(1, full_days + 1))
+        segments.append((end_date, (ended_at - last_midnight).total_seconds()))
+
+        self._add_durations(map_name, robot_id, state, segments)
+        if logger.isEnabledFor(logging.DEBUG):
+            for segment_date, duration in segments:
+                logger.debug(
+                    "[DailyStats] Robot %s: %s segment (duration: %.1fs on %s)",
+                    robot_id, state.value, duration, segment_date,
+                )
+
+    def _add_durations(
         self,
         map_name: str,
         robot_id: str,
         state: RobotOperationState,
-        duration: float,
-        target_date: date = None
+        segments: list[tuple[date, float]]
     ) -> None:
-        """특정 상태의 누적 시간 추가
+        """특정 상태의 날짜별 누적 시간 추가 (한 번의 왕복)
 
         Args:
             map_name: 맵 이름
             robot_id: 로봇 ID
             state: 상태
-            duration: 추가할 시간 (초)
-            target_date: 대상 날짜 (None이면 오늘)
+            segments: [(대상 날짜, 추가할 시간(초))] 목록
         """
-        stats_key = self._get_daily_stats_key(map_name, robot_id, target_date)
-        field = state.value
-
-        # 기존 누적 시간 조회
-        current_duration = redis_service.hget(stats_key, field)
-        current_duration = float(current_duration) if current_duration else 0.0
+        stats_key = self._get_daily_stats_key(map_name, robot_id)
 
-        # 누적 시간 업데이트
-        new_duration = current_duration + duration
-        redis_service.hset(stats_key, field, str(new_duration))
+        pipe = redis_service.pipeline()
+        if pipe is None:
+            return
 
-        # 통계 키 만료 시간 설정 (30일)
-        redis_service.expire(stats_key, 30 * 24 * 60 * 60)
+        # 날짜별 누적 시간 원자적 증가 + 통계 키 만료 시간 설정 (30일)
+        with pipe:
+            for target_date, duration in segments:
+                pipe.hincrbyfloat(stats_key, _stats_field(target_date, state.value), duration)
+            pipe.expire(stats_key, STATS_TTL_SECONDS)
+            pipe.execute()
 
     def get_daily_stats(
         self,
@@ -176,34 +337,99 @@ class DailyStatsService:
         Returns:
             {상태명: 시간(초)} 딕셔너리
         """
-        stats_key = self._get_daily_stats_key(map_name, robot_id, target_date)
-        stats = redis_service.hgetall(stats_key)
+        return self.get_daily_stats_bulk(map_name, [robot_id], target_date)[robot_id]
 
-        # 현재 진행 중인 상태의 시간도 포함
-        current_state_key = self._get_current_state_key(map_name, robot_id)
-        current_state_data = redis_service.hgetall(current_state_key)
+    def get_daily_stats_bulk(
+        self,
+        map_name: str,
+        robot_ids: list[str],
+        target_date: date = None
+    ) -> dict[str, dict[str, float]]:
+        """여러 로봇의 일일 통계를 한 번의 왕복으로 조회 (대시보드용)
 
-        result = {
-            "idle": 0.0,
-            "working": 0.0,
-            "full_charge_idle": 0.0,
-            "charging": 0.0
-        }
+        Args:
+            map_name: 맵 이름
+            robot_ids: 로봇 ID 목록
+            target_date: 대상 날짜 (None이면 오늘)
 
-        # Redis에 저장된 누적 시간
-        for state_value in result.keys():
-            if state_value in stats:
-                result[state_value] = float(stats[state_value])
+        Returns:
+            {로봇 ID: {상태명: 시간(초)}} 딕셔너리
+        """
+        # 로봇별 해당 날짜의 누적 통계 + 현재 진행 중인 상태를 하나의 파이프라인으로 조회
+        pipe = redis_service.pipeline()
+        if pipe is None:
+            replies = [[None] * len(_STATS_STATE_VALUES), {}] * len(robot_ids)
+        else:
+            with pipe:
+                self._queue_daily_stats_reads(pipe, map_name, robot_ids, target_date)
+                replies = pipe.execute()
+
+        return self._build_daily_stats(robot_ids, replies, target_date)
+
+    async def aget_daily_stats_bulk(
+        self,
+        map_name: str,
+        robot_ids: list[str],
+        target_date: date = None
+    ) -> dict[str, dict[str, float]]:
+        """get_daily_stats_bulk의 비동기 버전 (FastAPI 핸들러용)"""
+        pipe = redis_service.apipeline()
+        if pipe is None:
+            replies = [[None] * len(_STATS_STATE_VALUES), {}] * len(robot_ids)
+        else:
+            async with pipe:
+                self._queue_daily_stats_reads(pipe, map_name, robot_ids, target_date)
+                replies = await pipe.execute()
+
+        return self._build_daily_stats(robot_ids, replies, target_date)
+
+    def _queue_daily_stats_reads(self, pipe, map_name: str, robot_ids: list[str], target_date: Optional[date]) -> None:
+        """로봇별 통계 HMGET + 현재 상태 HGETALL을 파이프라인에 추가 (동기/비동기 공용)"""
+        fields = [_stats_field(target_date or date.today(), v) for v in _STATS_STATE_VALUES]
+        for robot_id in robot_ids:
+            pipe.hmget(self._get_daily_stats_key(map_name, robot_id), fields)
+            pipe.hgetall(self._get_current_state_key(map_name, robot_id))
+
+    def _build_daily_stats(
+        self,
+        robot_ids: list[str],
+        replies: list,
+        target_date: Optional[date]
+    ) -> dict[str, dict[str, float]]:
+        """_queue_daily_stats_reads 결과를 {로봇 ID: {상태명: 시간(초)}}로 변환
 
-        # 현재 진행 중인 상태의 시간 추가 (같은 날짜인 경우만)
-        if current_state_data and "state" in current_state_data and "started_at" in current_state_data:
-            started_at = datetime.fromisoformat(current_state_data["started_at"])
-            if target_date is None or started_at.date() == target_date:
-                current_state = current_state_data["state"]
-                ongoing_duration = (datetime.now() - started_at).total_seconds()
-                result[current_state] = result.get(current_state, 0.0) + ongoing_duration
+        Args:
+            robot_ids: 로봇 ID 목록
+            replies: 로봇마다 (HMGET 결과, HGETALL 결과) 순서의 파이프라인 응답
+            target_date: 대상 날짜 (None이면 오늘)
+        """
+        now_ts = time.time()
+        if target_date is not None:
+            # 대상 날짜 구간 [00시, 다음날 00시) (epoch 초)
+            day_start_ts = datetime.combine(target_date, datetime.min.time()).timestamp()
+            day_end_ts = datetime.combine(target_date + timedelta(days=1), datetime.min.time()).timestamp()
+
+        results = {}
+        for i, robot_id in enumerate(robot_ids):
+            stats, current_state_data = replies[2 * i], replies[2 * i + 1]
+
+            # Redis에 저장된 누적 시간
+            result = {
+                state_value: float(seconds) if seconds is not None else 0.0
+                for state_value, seconds in zip(_STATS_STATE_VALUES, stats)
+            }
 
-        return result
+            # 현재 진행 중인 상태의 시간 추가 (같은 날짜인 경우만)
+            if current_state_data and "state" in current_state_data:
+                started_ts = _started_at_ts(current_state_data)
+                if started_ts is not None and (target_date is None or day_start_ts <= started_ts < day_end_ts):
+                    current_state = current_state_data["state"]
+                    ongoing_duration = now_ts - started_ts
+                    result[current_state] = result.get(current_state, 0.0) + ongoing_duration
+
+            results[robot_id] = result
+
+        return results
 
     def get_daily_stats_formatted(
         self,
@@ -222,7 +448,39 @@ class DailyStatsService:
             통계 딕셔너리 (초, 분, 시간, 퍼센트 포함)
         """
         stats = self.get_daily_stats(map_name, robot_id, target_date)
+        return self._format_daily_stats(stats, target_date)
 
+    def get_daily_stats_formatted_bulk(
+        self,
+        map_name: str,
+        robot_ids: list[str],
+        target_date: date = None
+    ) -> dict[str, dict]:
+        """여러 로봇의 일일 통계 조회 (시간 형식 포함, 한 번의 왕복)
+
+        Args:
+            map_name: 맵 이름
+            robot_ids: 로봇 ID 목록
+            target_date: 대상 날짜 (None이면 오늘)
+
+        Returns:
+            {로봇 ID: 통계 딕셔너리} 딕셔너리
+        """
+        bulk = self.get_daily_stats_bulk(map_name, robot_ids, target_date)
+        return {robot_id: self._format_daily_stats(stats, target_date) for robot_id, stats in bulk.items()}
+
+    async def aget_daily_stats_formatted_bulk(
+        self,
+        map_name: str,
+        robot_ids: list[str],
+        target_date: date = None
+    ) -> dict[str, dict]:
+        """get_daily_stats_formatted_bulk의 비동기 버전 (FastAPI 핸들러용)"""
+        bulk = await self.aget_daily_stats_bulk(map_name, robot_ids, target_date)
+        return {robot_id: self._format_daily_stats(stats, target_date) for robot_id, stats in bulk.items()}
+
+    def _format_daily_stats(self, stats: dict[str, float], target_date: date = None) -> dict:
+        """{상태명: 시간(초)} 통계를 초/분/시간/퍼센트 형식으로 변환"""
         total_seconds = sum(stats.values())
         total_hours = total_seconds / 3600
 
@@ -247,6 +505,69 @@ class DailyStatsService:
 
         return result
 
+    def prune_old_stats(self, map_name: str, robot_id: str, today: date = None) -> int:
+        """보관 기간(30일)이 지난 날짜의 통계 필드 삭제
+
+        Args:
+            map_name: 맵 이름
+            robot_id: 로봇 ID
+            today: 기준 날짜 (None이면 오늘)
+
+        Returns:
+            삭제된 필드 개수
+        """
+        if not redis_service.client:
+            return 0
+        if today is None:
+            today = date.today()
+        stats_key = self._get_daily_stats_key(map_name, robot_id)
+        cutoff = (today - timedelta(days=STATS_RETENTION_DAYS)).isoformat()
+
+        # 필드명이 ISO 날짜로 시작하므로 문자열 비교로 기간 판단
+        old_fields = [f for f in redis_service.client.hkeys(stats_key) if f[:10] < cutoff]
+        if not old_fields:
+            return 0
+
+        redis_service.client.hdel(stats_key, *old_fields)
+        return len(old_fields)
+
+    def migrate_legacy_stats(self, today: date = None) -> int:
+        """이전 형식(날짜별 키) 통계를 로봇별 Hash의 "{날짜}:{상태}" 필드로 옮기기 (서버 시작 시 1회)
+
+        보관 기간이 지난 날짜의 키는 옮기지 않고 삭제합니다.
+        옮긴 키는 삭제되므로 다시 실행해도 안전합니다.
+
+        Args:
+            today: 기준 날짜 (None이면 오늘)
+
+        Returns:
+            옮긴 날짜별 키 개수
+        """
+        if not redis_service.client:
+            return 0
+        if today is None:
+            today = date.today()
+        cutoff = (today - timedelta(days=STATS_RETENTION_DAYS)).isoformat()
+
+        script = redis_service.register_script(_MIGRATE_LEGACY_STATS_LUA)
+        migrated = 0
+        for legacy_key in redis_service.client.scan_iter(match=_LEGACY_STATS_KEY_PATTERN, count=500):
+            # 키 형식: robot:daily_stats:{맵}:{로봇}:{YYYY-MM-DD}
+            prefix, _, day = legacy_key.rpartition(":")
+            if day < cutoff:
+                redis_service.client.delete(legacy_key)
+                continue
+
+            script(
+                keys=[legacy_key, prefix],
+                args=[day, STATS_TTL_SECONDS, STATS_TTL_REFRESH_BELOW],
+            )
+            migrated += 1
+
+        if migrated:
+            logger.info("[DailyStats] Migrated %d legacy per-date stats keys", migrated)
+        return migrated
+
     def get_current_state(self, map_name: str, robot_id: str) -> Optional[dict]:
         """현재 진행 중인 상태 조회
 
@@ -263,12 +584,12 @@ class DailyStatsService:
         if not current_state_data or "state" not in current_state_data:
             return None
 
-        started_at = datetime.fromisoformat(current_state_data["started_at"])
-        duration = (datetime.now() - started_at).total_seconds()
+        started_ts = _started_at_ts(current_state_data)
+        duration = time.time() - started_ts if started_ts is not None else 0.0
 
         return {
             "state": current_state_data["state"],
-            "started_at": current_state_data["started_at"],
+            "started_at": current_state_data.get("started_at"),
             "duration_seconds": round(duration, 1)
         }
 
@@ -1,17 +1,168 @@
 """로봇 상태 관리 서비스 - Redis에 로봇 데이터 저장/조회"""
-import json
-from typing import Optional, Union
+import asyncio
+import time
+from typing import Callable, Optional, Union
 from datetime import datetime
+from functools import lru_cache
 
+import orjson
+
+from app.config.settings import settings
 from app.util.redis.client import redis_service
+from app.util.redis.publisher import state_publish_coalescer
+from app.util.log import get_logger
 from app.domain.robot.robot_states import RobotOperationState
 from app.domain.robot.robot_status import RobotStatus
 from app.domain.robot.daily_stats_service import daily_stats_service
 
+logger = get_logger("robot_state")
+
+
+# Redis에서 문자열로 읽어 숫자로 변환하는 로봇 상태 필드
+_NUMERIC_FIELDS = (
+    ("current_node", int),
+    ("final_node", int),
+    ("battery_state", float),
+    ("charging_state", int),
+    ("node_count", int),
+)
+
+
+def _decode_state_fields(state: dict) -> dict:
+    """Redis에서 읽은 로봇 상태의 숫자 필드 변환 (in-place)
+
+    Args:
+        state: HGETALL 결과 딕셔너리
+
+    Returns:
+        숫자 필드가 변환된 같은 딕셔너리
+    """
+    for field, cast in _NUMERIC_FIELDS:
+        value = state.get(field)
+        if value is not None:
+            state[field] = cast(value)
+
+    return state
+
+
+# 쓰기 경로에서 쓰는 status 값 (enum 속성 조회를 import 시 한 번만)
+_STATUS_CHARGING = RobotStatus.CHARGING.value
+_STATUS_WAITING = RobotStatus.WAITING.value
+_STATUS_RETURN = RobotStatus.RETURN.value
+_STATUS_WORKING = RobotStatus.WORKING.value
+
+
+# 마지막으로 만든 updated_at 문자열 (epoch ms, ISO 문자열) - 같은 ms 안의 갱신은 문자열 재사용
+_last_updated_at: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """현재 시각 ISO 문자열 (ms 단위, 같은 ms 안에서는 캐시된 문자열 반환)"""
+    global _last_updated_at
+    ms = time.time_ns() // 1_000_000
+    cached_ms, cached_str = _last_updated_at
+    if ms == cached_ms:
+        return cached_str
+    now_str = datetime.fromtimestamp(ms / 1000).isoformat(timespec="milliseconds")
+    # 튜플 한 번 대입으로 교체 (MQTT/Redis 리스너 스레드 간 경합에도 ms와 문자열이 어긋나지 않음)
+    _last_updated_at = (ms, now_str)
+    return now_str
+
+
+# 위치 업데이트 Lua 스크립트 (충전 상태 조회 → status 결정 → 저장을 원자적으로 처리)
+# KEYS[1]: 로봇 상태 키, KEYS[2]: 현재 가동률 상태 키, KEYS[3]: 맵 로봇 인덱스 키
+# ARGV[1]: current_node, ARGV[2]: final_node ("" 이면 없음), ARGV[3]: updated_at, ARGV[4]: map_name, ARGV[5]: robot_id,
+# ARGV[6..9]: CHARGING, WAITING, RETURN, WORKING status 값
+# 반환: {저장 후 HGETALL 결과(flat), 현재 가동률 상태 또는 nil}
+_UPDATE_POSITION_LUA = """
+local fields = {'map_name', ARGV[4], 'track_no', '1', 'robot_id', ARGV[5], 'current_node', ARGV[1], 'updated_at', ARGV[3]}
+local has_final = ARGV[2] ~= ''
+if has_final then
+    table.insert(fields, 'final_node')
+    table.insert(fields, ARGV[2])
+end
+local status = nil
+if ARGV[1] == '1' then
+    if tonumber(redis.call('HGET', KEYS[1], 'charging_state')) == 1 then
+        status = ARGV[6]
+    else
+        status = ARGV[7]
+    end
+elseif has_final then
+    if ARGV[2] == '1' then
+        status = ARGV[8]
+    else
+        status = ARGV[9]
+    end
+end
+if status then
+    table.insert(fields, 'status')
+    table.insert(fields, status)
+end
+redis.call('HSET', KEYS[1], unpack(fields))
+redis.call('SADD', KEYS[3], ARGV[5])
+return {redis.call('HGETALL', KEYS[1]), redis.call('HGET', KEYS[2], 'state')}
+"""
+
+
+@lru_cache(maxsize=4096)
+def _robot_state_key(map_name: str, robot_id: str) -> str:
+    """로봇 상태 키 (맵/로봇별로 한 번만 생성)"""
+    return f"robot:state:{map_name}:{robot_id}"
+
+
+# 인덱스 백필용 SCAN 패턴 (_robot_state_key 형식)
+_ROBOT_STATE_KEY_PREFIX = "robot:state:"
+_ROBOT_STATE_KEY_PATTERN = f"{_ROBOT_STATE_KEY_PREFIX}*"
+
+
+@lru_cache(maxsize=4096)
+def _state_channel(map_name: str, robot_id: str) -> str:
+    """로봇 상태 변경 Pub/Sub 채널 (맵/로봇별로 한 번만 생성)"""
+    return f"{map_name}/robot/{robot_id}/state"
+
+
+# get_all_robots_in_map에서 한 파이프라인으로 읽는 로봇 수
+_ROBOT_READ_BATCH = 500
+
+# 이벤트 종류별 채널로 보내는 필드 (구독자가 필요한 이벤트만 받도록 변경 필드만 발행)
+_EVENT_FIELDS = {
+    "position": ("current_node", "final_node", "status", "updated_at"),
+    "battery": ("battery_state", "charging_state", "status", "updated_at"),
+    "status": ("status", "current_node", "updated_at"),
+}
+
+
+@lru_cache(maxsize=4096)
+def _event_channel(map_name: str, robot_id: str, event_type: str) -> str:
+    """로봇 이벤트 종류별 Pub/Sub 채널 (예: "map1/robot/1/position")"""
+    return f"{map_name}/robot/{robot_id}/{event_type}"
+
+
+@lru_cache(maxsize=256)
+def _state_stream_key(map_name: str) -> str:
+    """맵별 로봇 상태 Stream 키 (XREADGROUP 소비자용)"""
+    return f"stream:{map_name}:robot_state"
+
+
+@lru_cache(maxsize=256)
+def _robot_index_key(map_name: str) -> str:
+    """맵별 로봇 ID 인덱스(Set) 키"""
+    return f"robot:index:{map_name}"
+
 
 class RobotStateService:
     """로봇 상태를 Redis Hash에 저장하는 서비스"""
 
+    def __init__(self):
+        self._update_position_script = None
+
+    def _get_update_position_script(self):
+        """위치 업데이트 Lua 스크립트 (Redis 연결 후 최초 사용 시 등록)"""
+        if self._update_position_script is None:
+            self._update_position_script = redis_service.register_script(_UPDATE_POSITION_LUA)
+        return self._update_position_script
+
     def _parse_node_id(self, node_value) -> int:
         """노드 값에서 노드 ID 추출
 
@@ -36,59 +187,182 @@ class RobotStateService:
         Returns:
             Redis 키 (예: "robot:state:map1:robot1")
         """
-        return f"robot:state:{map_name}:{robot_id}"
+        return _robot_state_key(map_name, robot_id)
 
-    def _set_identity_fields(self, key: str, map_name: str, robot_id: str) -> None:
-        """mapName, trackNo, robotId 필드 저장"""
-        redis_service.hset(key, "map_name", map_name)
-        redis_service.hset(key, "track_no", "1")
-        redis_service.hset(key, "robot_id", robot_id)
+    def _identity_fields(self, map_name: str, robot_id: str) -> dict[str, str]:
+        """mapName, trackNo, robotId 필드 (다른 필드와 함께 한 번의 HSET으로 저장)"""
+        return {"map_name": map_name, "track_no": "1", "robot_id": robot_id}
 
-    def _publish_state_change(self, map_name: str, robot_id: str) -> None:
-        """로봇 상태 변경을 Redis Pub/Sub으로 전송
+    def _load_state(self, map_name: str, robot_id: str, key: str) -> tuple[dict, Optional[str]]:
+        """변경 전 로봇 상태 + 현재 가동률 상태를 한 번의 왕복으로 조회
 
         Args:
             map_name: 맵 이름
             robot_id: 로봇 ID
+            key: 로봇 상태 키
+
+        Returns:
+            (숫자 필드가 변환된 로봇 상태 딕셔너리, 현재 진행 중인 가동률 상태 값 또는 None)
         """
-        # 현재 상태 조회
-        state = self.get_robot_state(map_name, robot_id)
-        if not state:
-            return
+        pipe = redis_service.pipeline()
+        if pipe is None:
+            return {}, None
 
-        # Redis 채널로 상태 변경 전송
-        channel = f"{map_name}/robot/{robot_id}/state"
-        payload = json.dumps(state)
-        redis_service.publish(channel, payload)
+        with pipe:
+            pipe.hgetall(key)
+            pipe.hget(daily_stats_service.current_state_key(map_name, robot_id), "state")
+            state, operation_state = pipe.execute()
 
-    def _update_operation_state(self, map_name: str, robot_id: str) -> None:
-        """현재 RobotStatus → RobotOperationState 매핑하여 가동률 통계 업데이트
+        return _decode_state_fields(state), operation_state
 
-        RobotStatus가 Redis에 저장된 후 호출하여,
-        가동률 계산용 상태로 변환하여 일일 통계에 누적합니다.
+    def _apply_update(
+        self,
+        map_name: str,
+        robot_id: str,
+        event_type: str,
+        changes: dict[str, str],
+        status_rule: Optional[Callable[[dict], Optional[str]]] = None
+    ) -> Optional[dict]:
+        """로봇 상태 업데이트 공통 쓰기 경로
+
+        1. 변경 전 로봇 상태 + 현재 가동률 상태 조회 (한 번의 왕복)
+        2. 변경 사항 병합, status 및 가동률 상태 결정 (Redis를 다시 읽지 않고 Python에서 계산)
+        3. HSET + 맵 인덱스 SADD + 상태 발행 + 가동률 상태 전환(바뀐 경우)을 한 번의 왕복으로 실행
 
         Args:
             map_name: 맵 이름
             robot_id: 로봇 ID
+            event_type: 이벤트 종류 (_EVENT_FIELDS 키)
+            changes: 저장할 {필드: 값} 딕셔너리
+            status_rule: 변경 전 상태를 받아 새 status를 반환하는 함수 (None 반환 시 status 유지)
+
+        Returns:
+            저장 후 로봇 상태 딕셔너리 (미연결 시 None)
         """
-        state = self.get_robot_state(map_name, robot_id)
-        if not state or "status" not in state:
-            return
+        key = self._get_robot_key(map_name, robot_id)
+        state, current_operation_state = self._load_state(map_name, robot_id, key)
 
-        robot_status = RobotStatus(state["status"])
-        battery_state = state.get("battery_state", 0)
-        operation_state = RobotOperationState.from_robot_status(robot_status, battery_state)
+        mapping = self._identity_fields(map_name, robot_id)
+        mapping.update(changes)
+        mapping["updated_at"] = _now_iso()
+        if status_rule is not None:
+            status = status_rule(state)
+            if status is not None:
+                mapping["status"] = status
+
+        state.update(mapping)
+        _decode_state_fields(state)
+
+        if not self._commit_update(map_name, robot_id, event_type, state, current_operation_state, mapping):
+            return None
+
+        return state
+
+    def _commit_update(
+        self,
+        map_name: str,
+        robot_id: str,
+        event_type: str,
+        state: dict,
+        current_operation_state: Optional[str],
+        mapping: Optional[dict[str, str]] = None
+    ) -> bool:
+        """저장/발행/가동률 상태 전환을 하나의 파이프라인으로 실행
+
+        Args:
+            map_name: 맵 이름
+            robot_id: 로봇 ID
+            event_type: 이벤트 종류 (_EVENT_FIELDS 키)
+            state: 저장 후 로봇 상태
+            current_operation_state: 변경 전 진행 중인 가동률 상태 값 (없으면 None)
+            mapping: HSET할 {필드: 값} (None이면 이미 저장된 상태 - Lua 스크립트 경로)
+
+        Returns:
+            실행 여부 (미연결 시 False)
+
+        Raises:
+            ValueError: 알 수 없는 status (아무것도 저장/발행하기 전에 발생)
+        """
+        # 알 수 없는 status는 저장/발행 전에 거부
+        operation_state = self._operation_state_for(state)
+
+        pipe = redis_service.pipeline()
+        if pipe is None:
+            return False
+
+        finish_start_state = None
+        with pipe:
+            if mapping is not None:
+                pipe.hset(self._get_robot_key(map_name, robot_id), mapping=mapping)
+                pipe.sadd(_robot_index_key(map_name), robot_id)
+            self._publish_state_change(pipe, map_name, robot_id, state, event_type)
+            # 가동률 상태가 바뀌었을 때만 상태 전환 (ERROR는 가동률 누적하지 않음)
+            if operation_state is not None and current_operation_state != operation_state.value:
+                finish_start_state = daily_stats_service.queue_start_state(
+                    pipe, map_name, robot_id, operation_state
+                )
+            results = pipe.execute()
+
+        if finish_start_state is not None:
+            finish_start_state(results[-1])
+
+        return True
+
+    def _publish_state_change(self, pipe, map_name: str, robot_id: str, state: dict, event_type: str) -> None:
+        """로봇 상태 변경을 Redis Pub/Sub으로 전송 (파이프라인에 추가)
+
+        - {map}/robot/{id}/state: 전체 상태 스냅샷
+        - {map}/robot/{id}/{event_type}: 해당 이벤트의 변경 필드만
+        - stream:{map}:robot_state: 전체 상태 스냅샷 (REDIS_STATE_STREAM_MAXLEN > 0 일 때만, 유실 없는 소비용)
+
+        발행 병합이 켜져 있으면 전체 상태는 파이프라인 대신 병합기에 예약합니다 (채널별 마지막 상태만 발행).
+
+        Args:
+            pipe: 상태 저장과 함께 실행할 파이프라인
+            map_name: 맵 이름
+            robot_id: 로봇 ID
+            state: 변경 후 로봇 상태
+            event_type: 이벤트 종류 (_EVENT_FIELDS 키)
+        """
+        # 이벤트 채널은 변경 필드만 (병합하면 중간 이벤트가 사라지므로 바로 발행)
+        event = {field: state[field] for field in _EVENT_FIELDS[event_type] if field in state}
+        pipe.publish(_event_channel(map_name, robot_id, event_type), orjson.dumps(event))
+
+        # Stream은 소비자 그룹이 따라잡을 수 있도록 병합하지 않고 모든 변경을 기록 (길이는 근사 MAXLEN으로 제한)
+        stream_maxlen = settings.redis.state_stream_maxlen
+        if stream_maxlen > 0:
+            pipe.xadd(
+                _state_stream_key(map_name),
+                {"robot_id": robot_id, "event": event_type, "state": orjson.dumps(state)},
+                maxlen=stream_maxlen,
+                approximate=True,
+            )
 
-        # ERROR 상태는 가동률 누적하지 않음
-        if operation_state is None:
+        # Redis 채널로 상태 변경 전송
+        channel = _state_channel(map_name, robot_id)
+        if state_publish_coalescer.enabled:
+            state_publish_coalescer.publish_state(channel, state)
             return
 
-        # 현재 진행 중인 상태 확인
-        current_state_info = daily_stats_service.get_current_state(map_name, robot_id)
+        payload = orjson.dumps(state)
+        pipe.publish(channel, payload)
+
+    def _operation_state_for(self, state: Optional[dict]) -> Optional[RobotOperationState]:
+        """로봇 상태의 RobotStatus → RobotOperationState 매핑
 
-        # 상태가 변경되었을 때만 start_state 호출
-        if not current_state_info or current_state_info["state"] != operation_state.value:
-            daily_stats_service.start_state(map_name, robot_id, operation_state)
+        Args:
+            state: 로봇 상태
+
+        Returns:
+            가동률 상태 (status가 없거나 ERROR면 None)
+        """
+        if not state or "status" not in state:
+            return None
+
+        status = state["status"]
+        battery_state = state.get("battery_state", 0)
+        # 알 수 없는 status는 RobotStatus 변환에서 ValueError
+        return RobotOperationState.from_robot_status(RobotStatus(status), battery_state)
 
     def update_position(
         self,
@@ -115,38 +389,29 @@ class RobotStateService:
               - final_node가 1이 아니면 WORKING
             - node_count: 지나간 노드 개수를 누적 추적
         """
-        key = self._get_robot_key(map_name, robot_id)
-
-        self._set_identity_fields(key, map_name, robot_id)
-        redis_service.hset(key, "current_node", str(current_node))
-        redis_service.hset(key, "updated_at", datetime.now().isoformat())
-
-        if final_node is not None:
-            redis_service.hset(key, "final_node", str(final_node))
-
-        # currentNode 변경에 따른 status 자동 업데이트
-        if current_node == 1:
-            # 1번 노드(충전소)일 때: 충전 상태를 확인하여 status 결정
-            state = self.get_robot_state(map_name, robot_id)
-            charging = state.get("charging_state", 0) if state else 0
-            if charging == 1:
-                redis_service.hset(key, "status", RobotStatus.CHARGING.value)
-            else:
-                redis_service.hset(key, "status", RobotStatus.WAITING.value)
-        elif final_node is not None:
-            # final_node가 명시적으로 전달된 경우에만 status 변경
-            # final_node=1이면 RETURN(충전소 복귀), 그 외면 WORKING
-            if final_node == 1:
-                redis_service.hset(key, "status", RobotStatus.RETURN.value)
-            else:
-                redis_service.hset(key, "status", RobotStatus.WORKING.value)
-        # final_node=None이면 status 유지 (arrive/remove 시 현재 상태 보존)
-
-        # RobotStatus → 가동률 상태 매핑 및 통계 업데이트
-        self._update_operation_state(map_name, robot_id)
-
-        # 상태 변경 사항을 Redis Pub/Sub으로 전송
-        self._publish_state_change(map_name, robot_id)
+        script = self._get_update_position_script()
+        if script is None:
+            return True
+
+        # 충전 상태 조회 → status 결정 → 저장을 한 번의 왕복으로 원자 처리
+        # - 1번 노드(충전소): charging_state에 따라 CHARGING/WAITING
+        # - final_node가 전달된 경우: 1이면 RETURN(충전소 복귀), 그 외면 WORKING
+        # - final_node=None이면 status 유지 (arrive/remove 시 현재 상태 보존)
+        flat_state, operation_state = script(
+            keys=[
+                self._get_robot_key(map_name, robot_id),
+                daily_stats_service.current_state_key(map_name, robot_id),
+                _robot_index_key(map_name),
+            ],
+            args=[
+                current_node, "" if final_node is None else final_node, _now_iso(), map_name, robot_id,
+                _STATUS_CHARGING, _STATUS_WAITING, _STATUS_RETURN, _STATUS_WORKING,
+            ],
+        )
+        state = _decode_state_fields(dict(zip(flat_state[::2], flat_state[1::2])))
+
+        # 상태 발행 + 가동률 상태 전환(바뀐 경우)을 한 번의 왕복으로 실행
+        self._commit_update(map_name, robot_id, "position", state, operation_state)
 
         return True
 
@@ -162,28 +427,18 @@ class RobotStateService:
         Returns:
             성공 여부
         """
-        key = self._get_robot_key(map_name, robot_id)
-
-        self._set_identity_fields(key, map_name, robot_id)
-        redis_service.hset(key, "battery_state", str(battery_state))
-        redis_service.hset(key, "charging_state", str(charging_state))
-        redis_service.hset(key, "updated_at", datetime.now().isoformat())
-
-        # 배터리/충전 상태 변경 시 status도 업데이트 (현재 노드가 1인 경우에만)
-        state = self.get_robot_state(map_name, robot_id)
-        if state and state.get("current_node") == 1:
+        def battery_status(prev_state: dict) -> Optional[str]:
+            # 배터리/충전 상태 변경 시 status도 업데이트 (현재 노드가 1인 경우에만)
+            if prev_state.get("current_node") != 1:
+                return None
             # 1-0 노드에서 배터리/충전 상태 변경 시 status 재계산
             if charging_state == 1:
-                redis_service.hset(key, "status", RobotStatus.CHARGING.value)
-            else:
-                print(f"[RobotStateService] Robot {robot_id} at 1-0: Not charging, setting status to WAITING")
-                redis_service.hset(key, "status", RobotStatus.WAITING.value)
-
-        # RobotStatus → 가동률 상태 매핑 및 통계 업데이트
-        self._update_operation_state(map_name, robot_id)
+                return _STATUS_CHARGING
+            logger.debug("[RobotStateService] Robot %s at 1-0: Not charging, setting status to WAITING", robot_id)
+            return _STATUS_WAITING
 
-        # 상태 변경 사항을 Redis Pub/Sub으로 전송
-        self._publish_state_change(map_name, robot_id)
+        changes = {"battery_state": str(battery_state), "charging_state": str(charging_state)}
+        self._apply_update(map_name, robot_id, "battery", changes, battery_status)
 
         return True
 
@@ -205,22 +460,12 @@ class RobotStateService:
         Returns:
             성공 여부
         """
-        key = self._get_robot_key(map_name, robot_id)
-
-        self._set_identity_fields(key, map_name, robot_id)
         # RobotStatus enum이면 value 추출
-        status_value = status.value if isinstance(status, RobotStatus) else status
-        redis_service.hset(key, "status", status_value)
-        redis_service.hset(key, "updated_at", datetime.now().isoformat())
-
+        changes = {"status": status.value if isinstance(status, RobotStatus) else status}
         if node is not None:
-            redis_service.hset(key, "current_node", str(node))
-
-        # RobotStatus → 가동률 상태 매핑 및 통계 업데이트
-        self._update_operation_state(map_name, robot_id)
+            changes["current_node"] = str(node)
 
-        # 상태 변경 사항을 Redis Pub/Sub으로 전송
-        self._publish_state_change(map_name, robot_id)
+        self._apply_update(map_name, robot_id, "status", changes)
 
         return True
 
@@ -240,19 +485,75 @@ class RobotStateService:
         if not state:
             return None
 
-        # 숫자 필드 변환
-        if "current_node" in state:
-            state["current_node"] = int(state["current_node"])
-        if "final_node" in state:
-            state["final_node"] = int(state["final_node"])
-        if "battery_state" in state:
-            state["battery_state"] = float(state["battery_state"])
-        if "charging_state" in state:
-            state["charging_state"] = int(state["charging_state"])
-        if "node_count" in state:
-            state["node_count"] = int(state["node_count"])
+        return _decode_state_fields(state)
 
-        return state
+    async def aget_robot_state(self, map_name: str, robot_id: str) -> Optional[dict]:
+        """get_robot_state의 비동기 버전 (FastAPI 핸들러용)"""
+        if not redis_service.async_client:
+            return None
+
+        state = await redis_service.async_client.hgetall(self._get_robot_key(map_name, robot_id))
+        if not state:
+            return None
+
+        return _decode_state_fields(state)
+
+    def get_robot_operation_fields(self, map_name: str, robot_id: str) -> Optional[tuple[int, float, int]]:
+        """로봇 위치/배터리 필드만 조회 (HGETALL 대신 HMGET)
+
+        Args:
+            map_name: 맵 이름
+            robot_id: 로봇 ID
+
+        Returns:
+            (current_node, battery_state, charging_state) 또는 None (current_node 없음)
+        """
+        if not redis_service.client:
+            return None
+
+        key = self._get_robot_key(map_name, robot_id)
+        current_node, battery_state, charging_state = redis_service.client.hmget(
+            key, "current_node", "battery_state", "charging_state"
+        )
+        if current_node is None:
+            return None
+
+        return (
+            int(current_node),
+            float(battery_state) if battery_state is not None else 0.0,
+            int(charging_state) if charging_state is not None else 0,
+        )
+
+    def backfill_robot_index(self) -> int:
+        """기존 로봇 상태 키를 맵별 로봇 ID 인덱스에 등록 (서버 시작 시 1회)
+
+        인덱스 도입 전에 만들어진 robot:state 키도 get_all_robots_in_map에 바로 보이도록
+        SCAN으로 찾아 SADD합니다. 이미 등록된 로봇은 그대로이므로 다시 실행해도 안전합니다.
+
+        Returns:
+            확인한 로봇 상태 키 개수
+        """
+        if not redis_service.client:
+            return 0
+
+        count = 0
+        with redis_service.pipeline() as pipe:
+            for state_key in redis_service.client.scan_iter(match=_ROBOT_STATE_KEY_PATTERN, count=_ROBOT_READ_BATCH):
+                # 키 형식: robot:state:{맵}:{로봇}
+                map_key, _, robot_id = state_key.rpartition(":")
+                map_name = map_key[len(_ROBOT_STATE_KEY_PREFIX):]
+                if not map_name or not robot_id:
+                    continue
+                pipe.sadd(_robot_index_key(map_name), robot_id)
+                count += 1
+                # _ROBOT_READ_BATCH개마다 한 번의 왕복으로 전송
+                if count % _ROBOT_READ_BATCH == 0:
+                    pipe.execute()
+            pipe.execute()
+
+        if count:
+            logger.info("[RobotStateService] Backfilled robot index from %d state keys", count)
+        return count
 
     def get_all_robots_in_map(self, map_name: str) -> dict[str, dict]:
         """특정 맵의 모든 로봇 상태 조회
@@ -263,35 +564,65 @@ class RobotStateService:
         Returns:
             {robot_id: 상태} 딕셔너리
         """
-        pattern = f"robot:state:{map_name}:*"
         robots = {}
 
         if not redis_service.client:
             return robots
 
-        # 패턴 매칭으로 모든 키 찾기
-        for key in redis_service.client.scan_iter(match=pattern):
-            # 키에서 robot_id 추출
-            robot_id = key.split(":")[-1]
-            state = redis_service.hgetall(key)
+        # 맵별 로봇 ID 인덱스에서 조회 (전체 키 공간 SCAN 없이 해당 맵 로봇만)
+        index_key = _robot_index_key(map_name)
+        robot_ids = list(redis_service.client.smembers(index_key))
+        stale_ids = []
 
-            if state:
-                # 숫자 필드 변환
-                if "current_node" in state:
-                    state["current_node"] = int(state["current_node"])
-                if "final_node" in state:
-                    state["final_node"] = int(state["final_node"])
-                if "battery_state" in state:
-                    state["battery_state"] = float(state["battery_state"])
-                if "charging_state" in state:
-                    state["charging_state"] = int(state["charging_state"])
-                if "node_count" in state:
-                    state["node_count"] = int(state["node_count"])
-
-                robots[robot_id] = state
+        # _ROBOT_READ_BATCH개 단위로 HGETALL을 파이프라인으로 묶어 한 번에 조회
+        for i in range(0, len(robot_ids), _ROBOT_READ_BATCH):
+            batch = robot_ids[i:i + _ROBOT_READ_BATCH]
+            with redis_service.pipeline() as pipe:
+                for robot_id in batch:
+                    pipe.hgetall(self._get_robot_key(map_name, robot_id))
+                states = pipe.execute()
+            self._collect_states(batch, states, robots, stale_ids)
+
+        # 상태 키가 사라진 로봇은 인덱스에서 정리
+        if stale_ids:
+            redis_service.client.srem(index_key, *stale_ids)
+
+        return robots
+
+    async def aget_all_robots_in_map(self, map_name: str) -> dict[str, dict]:
+        """get_all_robots_in_map의 비동기 버전 (FastAPI 핸들러용, 배치 파이프라인을 동시에 실행)"""
+        robots = {}
+
+        if not redis_service.async_client:
+            return robots
+
+        index_key = _robot_index_key(map_name)
+        robot_ids = list(await redis_service.async_client.smembers(index_key))
+        batches = [robot_ids[i:i + _ROBOT_READ_BATCH] for i in range(0, len(robot_ids), _ROBOT_READ_BATCH)]
+
+        async def read_batch(batch: list[str]) -> list[dict]:
+            async with redis_service.apipeline() as pipe:
+                for robot_id in batch:
+                    pipe.hgetall(self._get_robot_key(map_name, robot_id))
+                return await pipe.execute()
+
+        stale_ids = []
+        for batch, states in zip(batches, await asyncio.gather(*(read_batch(b) for b in batches))):
+            self._collect_states(batch, states, robots, stale_ids)
+
+        if stale_ids:
+            await redis_service.async_client.srem(index_key, *stale_ids)
 
         return robots
 
+    def _collect_states(self, robot_ids: list[str], states: list[dict], robots: dict[str, dict], stale_ids: list[str]) -> None:
+        """HGETALL 결과를 robots에 디코딩해 담고, 상태 키가 없는 로봇은 stale_ids에 추가"""
+        for robot_id, state in zip(robot_ids, states):
+            if state:
+                robots[robot_id] = _decode_state_fields(state)
+            else:
+                stale_ids.append(robot_id)
+
     def delete_robot_state(self, map_name: str, robot_id: str) -> bool:
         """로봇 상태 삭제
 
@@ -302,8 +633,28 @@ class RobotStateService:
         Returns:
             성공 여부
         """
-        key = self._get_robot_key(map_name, robot_id)
-        return redis_service.delete(key)
+        pipe = redis_service.pipeline()
+        if pipe is None:
+            return False
+
+        # 상태 키 삭제 + 맵 인덱스에서 제거 (한 번의 왕복)
+        with pipe:
+            pipe.delete(self._get_robot_key(map_name, robot_id))
+            pipe.srem(_robot_index_key(map_name), robot_id)
+            pipe.execute()
+        return True
+
+    async def adelete_robot_state(self, map_name: str, robot_id: str) -> bool:
+        """delete_robot_state의 비동기 버전 (FastAPI 핸들러용)"""
+        pipe = redis_service.apipeline()
+        if pipe is None:
+            return False
+
+        async with pipe:
+            pipe.delete(self._get_robot_key(map_name, robot_id))
+            pipe.srem(_robot_index_key(map_name), robot_id)
+            await pipe.execute()
+        return True
 
 
 robot_state_service = RobotStateService()
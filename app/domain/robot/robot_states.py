@@ -1,9 +1,7 @@
 """로봇 가동률 계산용 상태 정의"""
 from enum import Enum
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from app.domain.robot.robot_status import RobotStatus
+from app.domain.robot.robot_status import RobotStatus
 
 
 class RobotOperationState(Enum):
@@ -19,7 +17,7 @@ class RobotOperationState(Enum):
     CHARGING = "charging"                # 충전 중 (CHARGING)
 
     @staticmethod
-    def from_robot_status(robot_status: "RobotStatus", battery_state: float = 0) -> "RobotOperationState | None":
+    def from_robot_status(robot_status: RobotStatus, battery_state: float = 0) -> "RobotOperationState | None":
         """RobotStatus와 배터리 상태에서 가동률 상태로 매핑
 
         Args:
@@ -29,22 +27,24 @@ class RobotOperationState(Enum):
         Returns:
             RobotOperationState (ERROR 시 None 반환 → 가동률 누적 안함)
         """
-        from app.domain.robot.robot_status import RobotStatus
-
-        # 작업 중
-        if robot_status in (RobotStatus.WORKING, RobotStatus.RETURN):
-            return RobotOperationState.WORKING
-
-        # 충전 중
-        if robot_status == RobotStatus.CHARGING:
-            return RobotOperationState.CHARGING
-
-        # 대기/도착 상태 → 배터리 레벨로 구분
-        if robot_status in (RobotStatus.WAITING, RobotStatus.DONE):
-            if battery_state >= 100:
-                return RobotOperationState.FULL_CHARGE_IDLE
-            else:
-                return RobotOperationState.IDLE
+        states = _OPERATION_STATES_BY_STATUS.get(robot_status)
 
         # ERROR는 가동률 누적하지 않음
-        return None
+        if states is None:
+            return None
+
+        # 대기/도착 상태만 배터리 레벨로 구분 (완충 여부로 인덱싱)
+        return states[battery_state >= 100]
+
+
+# RobotStatus → (배터리 100 미만일 때, 완충일 때) 가동률 상태
+_OPERATION_STATES_BY_STATUS: dict[RobotStatus, tuple[RobotOperationState, RobotOperationState]] = {
+    # 작업 중
+    RobotStatus.WORKING: (RobotOperationState.WORKING, RobotOperationState.WORKING),
+    RobotStatus.RETURN: (RobotOperationState.WORKING, RobotOperationState.WORKING),
+    # 충전 중
+    RobotStatus.CHARGING: (RobotOperationState.CHARGING, RobotOperationState.CHARGING),
+    # 대기/도착 상태 → 배터리 레벨로 구분
+    RobotStatus.WAITING: (RobotOperationState.IDLE, RobotOperationState.FULL_CHARGE_IDLE),
+    RobotStatus.DONE: (RobotOperationState.IDLE, RobotOperationState.FULL_CHARGE_IDLE),
+}
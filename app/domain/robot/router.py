@@ -1,8 +1,9 @@
 """로봇 상태 조회 API 라우터"""
 from datetime import datetime, date
+from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends
 
-from app.domain.robot.robot_state_service import robot_state_service
+from app.domain.robot.robot_state_service import _robot_index_key, _robot_state_key, robot_state_service
 from app.domain.robot.daily_stats_service import daily_stats_service
 from app.domain.robot.robot_states import RobotOperationState
 from app.util.redis.client import redis_service
@@ -25,7 +26,7 @@ async def get_robot_state(
     Returns:
         로봇 상태 정보
     """
-    state = robot_state_service.get_robot_state(map_name, robot_id)
+    state = await robot_state_service.aget_robot_state(map_name, robot_id)
 
     if not state:
         raise HTTPException(status_code=404, detail=f"Robot {robot_id} not found in map {map_name}")
@@ -47,7 +48,7 @@ async def get_all_robots_in_map(map_name: str = Depends(validate_map_name)):
     Returns:
         맵 내 모든 로봇의 상태 정보
     """
-    robots = robot_state_service.get_all_robots_in_map(map_name)
+    robots = await robot_state_service.aget_all_robots_in_map(map_name)
 
     return {
         "map_name": map_name,
@@ -56,6 +57,38 @@ async def get_all_robots_in_map(map_name: str = Depends(validate_map_name)):
     }
 
 
+@router.get("/{map_name}/stats/daily")
+async def get_daily_stats_in_map(
+    target_date: Optional[str] = None,
+    map_name: str = Depends(validate_map_name)
+):
+    """특정 맵의 모든 로봇 일일 가동률 통계 조회 (대시보드용)
+
+    Args:
+        target_date: 날짜 (YYYY-MM-DD 형식, 없으면 오늘)
+        map_name: 맵 이름 (smartfarm_ prefix 필수)
+
+    Returns:
+        로봇별 가동률 통계
+    """
+    parsed_date = None
+    if target_date is not None:
+        try:
+            parsed_date = date.fromisoformat(target_date)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    robot_ids = list((await robot_state_service.aget_all_robots_in_map(map_name)).keys())
+    stats = await daily_stats_service.aget_daily_stats_formatted_bulk(map_name, robot_ids, parsed_date)
+
+    return {
+        "map_name": map_name,
+        "date": (parsed_date or date.today()).isoformat(),
+        "robot_count": len(stats),
+        "robots": stats
+    }
+
+
 @router.delete("/{map_name}/{robot_id}")
 async def delete_robot_state(
     robot_id: str,
@@ -70,7 +103,7 @@ async def delete_robot_state(
     Returns:
         삭제 결과
     """
-    success = robot_state_service.delete_robot_state(map_name, robot_id)
+    success = await robot_state_service.adelete_robot_state(map_name, robot_id)
 
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete robot state")
@@ -88,30 +121,46 @@ async def create_dummy_data(map_name: str = Depends(validate_map_name)):
     now = datetime.now()
     today = date.today()
 
+    pipe = redis_service.apipeline()
+    if pipe is None:
+        raise HTTPException(status_code=500, detail="Failed to create dummy data (Redis not connected)")
+
     # 1. 로봇 상태 데이터
-    state_key = f"robot:state:{map_name}:{robot_id}"
-    redis_service.hset(state_key, "map_name", map_name)
-    redis_service.hset(state_key, "track_no", "1")
-    redis_service.hset(state_key, "robot_id", robot_id)
-    redis_service.hset(state_key, "current_node", "2")
-    redis_service.hset(state_key, "final_node", "2")
-    redis_service.hset(state_key, "battery_state", "100")
-    redis_service.hset(state_key, "charging_state", "0")
-    redis_service.hset(state_key, "status", "idle")
-    redis_service.hset(state_key, "updated_at", now.isoformat())
+    state_key = _robot_state_key(map_name, robot_id)
+    pipe.hset(state_key, mapping={
+        "map_name": map_name,
+        "track_no": "1",
+        "robot_id": robot_id,
+        "current_node": "2",
+        "final_node": "2",
+        "battery_state": "100",
+        "charging_state": "0",
+        "status": "idle",
+        "updated_at": now.isoformat(),
+    })
+    pipe.sadd(_robot_index_key(map_name), robot_id)
 
     # 2. 현재 운영 상태 추적
     current_state_key = f"robot:current_state:{map_name}:{robot_id}"
-    redis_service.hset(current_state_key, "state", RobotOperationState.IDLE.value)
-    redis_service.hset(current_state_key, "started_at", now.isoformat())
-
-    # 3. 오늘 가동률 더미 통계 (8시간 기준)
-    stats_key = f"robot:daily_stats:{map_name}:{robot_id}:{today.isoformat()}"
-    redis_service.hset(stats_key, "working", "14400")       # 4시간
-    redis_service.hset(stats_key, "charging", "3600")        # 1시간
-    redis_service.hset(stats_key, "full_charge_idle", "7200") # 2시간
-    redis_service.hset(stats_key, "idle", "3600")            # 1시간
-    redis_service.expire(stats_key, 30 * 24 * 60 * 60)
+    pipe.hset(current_state_key, mapping={
+        "state": RobotOperationState.IDLE.value,
+        "started_at": now.isoformat(),
+        "started_at_ts": str(now.timestamp()),
+    })
+
+    # 3. 오늘 가동률 더미 통계 (8시간 기준, "{날짜}:{상태}" 필드)
+    stats_key = f"robot:daily_stats:{map_name}:{robot_id}"
+    day = today.isoformat()
+    pipe.hset(stats_key, mapping={
+        f"{day}:working": "14400",          # 4시간
+        f"{day}:charging": "3600",          # 1시간
+        f"{day}:full_charge_idle": "7200",  # 2시간
+        f"{day}:idle": "3600",              # 1시간
+    })
+    pipe.expire(stats_key, 30 * 24 * 60 * 60)
+
+    # 모든 명령을 한 번의 왕복으로 실행
+    await pipe.execute()
 
     return {
         "message": f"Dummy data created for {robot_id} in {map_name}",
@@ -138,13 +187,21 @@ async def create_dummy_daily_stats(
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
     robot_id = "1"
-    stats_key = f"robot:daily_stats:{map_name}:{robot_id}:{parsed_date.isoformat()}"
-
-    redis_service.hset(stats_key, "working", "14400")        # 4시간
-    redis_service.hset(stats_key, "charging", "3600")         # 1시간
-    redis_service.hset(stats_key, "full_charge_idle", "7200")  # 2시간
-    redis_service.hset(stats_key, "idle", "3600")             # 1시간
-    redis_service.expire(stats_key, 30 * 24 * 60 * 60)
+    stats_key = f"robot:daily_stats:{map_name}:{robot_id}"
+    day = parsed_date.isoformat()
+
+    pipe = redis_service.apipeline()
+    if pipe is None:
+        raise HTTPException(status_code=500, detail="Failed to create dummy data (Redis not connected)")
+
+    pipe.hset(stats_key, mapping={
+        f"{day}:working": "14400",          # 4시간
+        f"{day}:charging": "3600",          # 1시간
+        f"{day}:full_charge_idle": "7200",  # 2시간
+        f"{day}:idle": "3600",              # 1시간
+    })
+    pipe.expire(stats_key, 30 * 24 * 60 * 60)
+    await pipe.execute()
 
     return {
         "message": f"Dummy daily stats created for {robot_id} in {map_name}",
@@ -0,0 +1,51 @@
+"""QueueHandler/QueueListener 기반 로깅 설정 - 로그 출력 I/O를 백그라운드 스레드에서 처리"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+APP_LOGGER_NAME = "app"
+
+
+def get_logger(name: str) -> logging.Logger:
+    """앱 하위 로거 반환
+
+    Args:
+        name: 로거 이름 (예: "path" → "app.path")
+
+    Returns:
+        logging.Logger
+    """
+    return logging.getLogger(f"{APP_LOGGER_NAME}.{name}")
+
+
+class QueueLogging:
+    """앱 로거의 출력을 큐에 넣고 별도 스레드에서 stdout으로 기록"""
+
+    def __init__(self):
+        self.listener: QueueListener = None
+
+    def start(self, level: int = logging.INFO):
+        """로깅 시작 (요청 처리 스레드는 큐에 넣기만 하고 바로 반환)"""
+        if self.listener:
+            return
+
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        app_logger = logging.getLogger(APP_LOGGER_NAME)
+        app_logger.setLevel(level)
+        app_logger.addHandler(QueueHandler(log_queue))
+        app_logger.propagate = False
+
+        self.listener = QueueListener(log_queue, stream_handler)
+        self.listener.start()
+
+    def stop(self):
+        """로깅 종료 (큐에 남은 로그를 모두 출력한 뒤 스레드 종료)"""
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+
+
+queue_logging = QueueLogging()
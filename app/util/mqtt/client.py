@@ -1,5 +1,6 @@
 import re
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union
 
 import paho.mqtt.client as mqtt
 
@@ -9,12 +10,17 @@ if TYPE_CHECKING:
     from app.util.mqtt.handler import MQTTHandler
 
 
-def mqtt_match(pattern: str, topic: str) -> bool:
-    """MQTT 토픽 패턴 매칭 (+, # 와일드카드 지원)"""
+@lru_cache(maxsize=128)
+def compile_topic_pattern(pattern: str) -> re.Pattern:
+    """MQTT 토픽 패턴을 정규식으로 컴파일 (패턴별로 한 번만)"""
     # + -> 단일 레벨 매칭, # -> 다중 레벨 매칭
     regex = pattern.replace("+", "[^/]+").replace("#", ".+")
-    regex = f"^{regex}$"
-    return re.match(regex, topic) is not None
+    return re.compile(f"^{regex}$")
+
+
+def mqtt_match(pattern: str, topic: str) -> bool:
+    """MQTT 토픽 패턴 매칭 (+, # 와일드카드 지원)"""
+    return compile_topic_pattern(pattern).match(topic) is not None
 
 
 class MQTTService:
@@ -22,7 +28,7 @@ class MQTTService:
         self.broker = settings.mqtt.broker
         self.port = settings.mqtt.port
         self.client: mqtt.Client = None
-        self._handlers: dict[str, "MQTTHandler"] = {}  # topic -> handler
+        self._handlers: dict[str, tuple[re.Pattern, "MQTTHandler"]] = {}  # topic -> (컴파일된 패턴, handler)
 
     def _on_connect(self, client, userdata, flags, rc, properties=None):
         if rc == 0:
@@ -39,16 +45,16 @@ class MQTTService:
         print(f"MQTT 메시지 수신 - 토픽: {topic}, 페이로드: {payload}")
 
         # 매칭되는 핸들러 호출
-        for pattern, handler in self._handlers.items():
-            if mqtt_match(pattern, topic):
+        for pattern, (compiled, handler) in self._handlers.items():
+            if compiled.match(topic):
                 try:
                     handler.handle(topic, payload)
                 except Exception as e:
                     print(f"핸들러 오류 [{pattern}]: {e}")
 
     def register_handler(self, handler: "MQTTHandler"):
-        """핸들러 등록"""
-        self._handlers[handler.topic] = handler
+        """핸들러 등록 (토픽 패턴은 등록 시 한 번만 컴파일)"""
+        self._handlers[handler.topic] = (compile_topic_pattern(handler.topic), handler)
 
         # 이미 연결된 상태면 바로 구독
         if self.client and self.client.is_connected():
@@ -80,10 +86,18 @@ class MQTTService:
         if self.client and self.client.is_connected():
             self.client.subscribe(topic)
 
-    def publish(self, topic: str, payload: str) -> bool:
+    def publish(self, topic: str, payload: Union[str, bytes]) -> bool:
+        """메시지 발행 (논블로킹, 직렬화된 bytes는 그대로 전송)
+
+        loop_start()로 띄운 네트워크 스레드가 실제 전송을 담당하므로
+        호출 스레드는 큐에 넣은 뒤 바로 반환합니다.
+
+        Returns:
+            큐 등록 성공 여부
+        """
         if self.client and self.client.is_connected():
-            self.client.publish(topic, payload)
-            return True
+            info = self.client.publish(topic, payload)
+            return info.rc == mqtt.MQTT_ERR_SUCCESS
         return False
 
     def is_connected(self) -> bool:
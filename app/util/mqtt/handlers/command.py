@@ -1,14 +1,17 @@
-import json
+import orjson
+from functools import lru_cache
+from typing import ClassVar
 
 from app.util.mqtt.handler import MQTTHandler
 from app.util.mqtt.client import mqtt_service
+from app.util.mqtt.workers import mqtt_workers
 from app.util.mqtt.handlers.models import (
     PathPayload,
     BatteryPayload,
     ArrivePayload,
     RemovePathPayload,
 )
-from app.util.redis.init_data import release_node, release_robot_nodes
+from app.util.redis.init_data import invalidate_nodes_cache, release_node, release_robot_nodes
 from app.util.redis.client import redis_service
 from app.domain.path.path_service import path_calculation_service
 from app.domain.robot.robot_state_service import robot_state_service
@@ -16,9 +19,48 @@ from app.domain.robot.robot_status import RobotStatus
 from app.util.validators import MapNameValidator
 
 
+# 메시지마다 orjson 모듈 속성 조회를 하지 않도록 한 번만 바인딩
+_loads = orjson.loads
+_dumps = orjson.dumps
+
+
+# 배터리 전압 → 퍼센트 변환 상수
+_MAX_VOLT = 16.5
+_MIN_VOLT = 13.5
+_VOLT_RANGE = _MAX_VOLT - _MIN_VOLT
+_CHARGING_FACTOR = 0.07  # 충전 중 전압 보정 비율
+
+# 도착 확인 응답 (내용이 항상 같으므로 한 번만 직렬화)
+_ARRIVE_ACK = _dumps({"yes_or_no": "yes"})
+
+
+@lru_cache(maxsize=1024)
+def _arrive_topic(map_name: str, robot_id: str) -> str:
+    """도착 확인 응답 MQTT 토픽 (맵/로봇별로 한 번만 생성)"""
+    return f"{map_name}/{robot_id}/server/arrive"
+
+
+@lru_cache(maxsize=1024)
+def _parse_path_nodes(path_nodes_str: str) -> tuple[int, ...]:
+    """저장된 경로 노드 문자열("2,3,4") 파싱 (같은 경로의 remove 메시지마다 다시 split하지 않음)"""
+    return tuple(int(n) for n in path_nodes_str.split(","))
+
+
 class CommandHandler(MQTTHandler):
     """로봇 명령 핸들러 - 토픽 마지막 부분으로 명령 구분"""
 
+    # 명령 → 처리 메서드 이름 (클래스 단위로 한 번만 정의, elif 비교 없이 dict 조회 한 번)
+    _DISPATCH: ClassVar[dict[str, str]] = {
+        "path_plan": "_handle_path",
+        "battery": "_handle_battery",
+        "arrive": "_handle_arrive",
+        "remove_path": "_handle_remove",
+        "robot_error": "_handle_error",
+    }
+
+    # 큐가 가득 찼을 때 버려도 되는 명령 (다음 메시지가 최신 값으로 대체)
+    _DROPPABLE: ClassVar[frozenset[str]] = frozenset({"battery"})
+
     @property
     def topic(self) -> str:
         return "+/+/robot/+"
@@ -30,21 +72,22 @@ class CommandHandler(MQTTHandler):
 
         map_name, robot_id, _, command = parts
 
+        # Redis/BFS 처리는 워커에서 실행해 MQTT 수신 스레드를 막지 않음 (같은 로봇의 메시지는 순서 유지)
+        mqtt_workers.submit(
+            f"{map_name}/{robot_id}", self._dispatch, map_name, robot_id, command, payload,
+            droppable=command in self._DROPPABLE,
+        )
+
+    def _dispatch(self, map_name: str, robot_id: str, command: str, payload: str) -> None:
+        """명령별 처리 메서드 호출 (워커 스레드에서 실행)"""
         # 맵 이름 검증
         if not MapNameValidator.validate_silent(map_name):
             print(f"[MQTT] Invalid map name: {map_name}. Must start with 'smartfarm_'. Ignoring message.")
             return
 
-        if command == "path_plan":
-            self._handle_path(map_name, robot_id, payload)
-        elif command == "battery":
-            self._handle_battery(map_name, robot_id, payload)
-        elif command == "arrive":
-            self._handle_arrive(map_name, robot_id, payload)
-        elif command == "remove_path":
-            self._handle_remove(map_name, robot_id, payload)
-        elif command == "robot_error":
-            self._handle_error(map_name, robot_id, payload)
+        method_name = self._DISPATCH.get(command)
+        if method_name is not None:
+            getattr(self, method_name)(map_name, robot_id, payload)
 
     def _determine_destination(self, final_node: int) -> tuple[int, bool]:
         """목적지 결정 (복귀 로직)
@@ -64,7 +107,7 @@ class CommandHandler(MQTTHandler):
 
     def _handle_path(self, map_name: str, robot_id: str, payload: str) -> None:
         """경로 계산 요청 처리 - BFS로 경로 계산 후 MQTT로 응답"""
-        data = PathPayload(**json.loads(payload))
+        data = PathPayload.model_validate_json(payload)
 
         # 목적지 결정 (복귀 로직 처리)
         destination, is_return = self._determine_destination(data.final_node)
@@ -82,7 +125,7 @@ class CommandHandler(MQTTHandler):
 
     def _handle_battery(self, map_name: str, robot_id: str, payload: str) -> None:
         """배터리 상태 처리 - Redis에 저장"""
-        data = BatteryPayload(**json.loads(payload))
+        data = BatteryPayload.model_validate_json(payload)
 
         # 전압을 퍼센트로 변환
         battery_percent = self._calculate_battery_percent(
@@ -96,45 +139,44 @@ class CommandHandler(MQTTHandler):
 
     def _calculate_battery_percent(self, input_volt: float, charging_state: int) -> int:
         """배터리 전압을 퍼센트로 변환"""
-        max_volt = 16.5
-        min_volt = 13.5
-
-        # 충전 상수 (충전 중일 때 전압 보정)
-        charging_constant = (max_volt - input_volt) * 0.07
-
-        # 충전 중이면 충전 상수 적용
-        if charging_state == 1:
-            input_volt -= charging_constant
+        # 충전 중이면 충전 상수만큼 전압 보정 (미충전 시 0을 곱해 분기 없이 처리)
+        input_volt -= (_MAX_VOLT - input_volt) * _CHARGING_FACTOR * (charging_state == 1)
 
         # 퍼센트 계산
-        battery_percent = round((input_volt - min_volt) / (max_volt - min_volt) * 100)
+        battery_percent = round((input_volt - _MIN_VOLT) / _VOLT_RANGE * 100)
 
         # 0~100 범위로 제한
-        return max(0, min(100, battery_percent))
+        return 0 if battery_percent < 0 else 100 if battery_percent > 100 else battery_percent
 
     def _handle_arrive(self, map_name: str, robot_id: str, payload: str) -> None:
         """로봇 도착 처리 - 해당 로봇이 점유한 모든 노드 해제"""
-        data = ArrivePayload(**json.loads(payload))
+        data = ArrivePayload.model_validate_json(payload)
 
         # Redis에 current_node 업데이트 (도착한 노드로 위치 변경)
         robot_state_service.update_position(map_name, robot_id, data.current_node)
 
-        # 도착 키를 별도로 저장하고 3분(180초) 후 만료
-        arrive_key = f"robot:arrive:{map_name}:{robot_id}"
-        redis_service.set(arrive_key, str(data.current_node), ex=180)
-
-        # 해당 로봇이 점유한 모든 노드 해제
-        released_count = release_robot_nodes(map_name, robot_id)
+        # 도착 키 저장(3분 후 만료) + 해당 로봇이 점유한 모든 노드 해제를 한 번의 왕복으로 실행
+        released_count = 0
+        pipe = redis_service.pipeline()
+        if pipe is not None:
+            with pipe:
+                arrive_key = f"robot:arrive:{map_name}:{robot_id}"
+                pipe.set(arrive_key, str(data.current_node), ex=180)
+                released_count = release_robot_nodes(map_name, robot_id, pipe)
+                pipe.execute()
+            # 해제가 Redis에 반영된 뒤에 캐시 무효화 (그 사이 다른 워커가 이전 점유 상태를 다시 캐시하지 않도록)
+            if released_count:
+                invalidate_nodes_cache(map_name)
         print(f"[Arrive] Robot {robot_id} arrived at node {data.current_node}. Released {released_count} nodes.")
 
         # 도착 확인 응답 전송
-        response_topic = f"{map_name}/{robot_id}/server/arrive"
-        response_payload = json.dumps({"yes_or_no": "yes"})
-        mqtt_service.publish(response_topic, response_payload)
+        mqtt_service.publish(_arrive_topic(map_name, robot_id), _ARRIVE_ACK)
 
     def _handle_remove(self, map_name: str, robot_id: str, payload: str) -> None:
         """경로 노드 해제 - 특정 노드의 점유 해제"""
-        data = RemovePathPayload(**json.loads(payload))
+        # payload는 한 번만 파싱해서 모델 생성과 publish 메시지에 함께 사용
+        payload_data = _loads(payload)
+        data = RemovePathPayload.model_validate(payload_data)
 
         robot_state_service.update_position(map_name, robot_id, data.current_node)
 
@@ -146,25 +188,26 @@ class CommandHandler(MQTTHandler):
             print(f"[Remove] Failed to release node {data.current_node} for robot {robot_id}.")
 
         path_key = f"robot:path:{map_name}:{robot_id}"
-        is_return_str = redis_service.hget(path_key, "is_return")
+        is_return_str, path_nodes_str, path_index_str = redis_service.hmget(
+            path_key, "is_return", "path_nodes", "path_index"
+        )
 
         # 경로 주행 순서 검증 + 실제 이동 노드 수 확정
         nodes_traversed = 1  # 기본값
-        path_nodes_str = redis_service.hget(path_key, "path_nodes")
-        path_index_str = redis_service.hget(path_key, "path_index")
+        new_path_index = None  # 진행 위치가 바뀐 경우에만 저장
         if path_nodes_str and path_index_str is not None:
-            path_nodes = [int(n) for n in path_nodes_str.split(",")]
+            path_nodes = _parse_path_nodes(path_nodes_str)
             path_index = int(path_index_str)
             if path_index < len(path_nodes):
                 expected = path_nodes[path_index]
                 if data.current_node == expected:
                     nodes_traversed = 1
-                    redis_service.hset(path_key, "path_index", str(path_index + 1))
+                    new_path_index = path_index + 1
                     print(f"[Remove] Robot {robot_id}: path OK [{path_index + 1}/{len(path_nodes)}] node {data.current_node}")
                 elif data.current_node in path_nodes[path_index:]:
                     new_index = path_nodes.index(data.current_node, path_index) + 1
                     nodes_traversed = new_index - path_index
-                    redis_service.hset(path_key, "path_index", str(new_index))
+                    new_path_index = new_index
                     print(f"[Remove] Robot {robot_id}: path WARNING - skipped {nodes_traversed - 1} node(s), expected {expected} got {data.current_node} [{new_index}/{len(path_nodes)}]")
                 else:
                     print(f"[Remove] Robot {robot_id}: path ERROR - unexpected node {data.current_node}, expected {expected} [{path_index}/{len(path_nodes)}]")
@@ -173,21 +216,27 @@ class CommandHandler(MQTTHandler):
         unit = 3 if is_return_str == "True" else 1
         increment = nodes_traversed * unit
         current_state_key = f"robot:current_state:{map_name}:{robot_id}"
-        current_count_str = redis_service.hget(current_state_key, "node_count")
-        current_count = int(current_count_str) if current_count_str else 0
-        new_count = current_count + increment
-        redis_service.hset(current_state_key, "node_count", str(new_count))
-        print(f"[Remove] Robot {robot_id}: node_count +{increment} ({nodes_traversed} node(s) × {unit}, total: {new_count})")
 
-        # Redis로 remove 정보 publish
-        payload_data = json.loads(payload)
-        if "final_node" in payload_data:
-            del payload_data["final_node"]
-        message = json.dumps({
+        # Redis로 보낼 remove 정보
+        payload_data.pop("final_node", None)
+        message = _dumps({
             "type": "REMOVE",
             "payload": payload_data
         })
-        redis_service.publish("smartfarm:robot", message)
+
+        # 경로 진행 위치 저장 + node_count 누적 + remove 정보 publish를 한 번의 왕복으로 실행
+        # (node_count는 HINCRBY로 원자적 누적 - 다른 메시지가 끼어들어도 누락되지 않음)
+        pipe = redis_service.pipeline()
+        if pipe is None:
+            return
+
+        with pipe:
+            if new_path_index is not None:
+                pipe.hset(path_key, "path_index", str(new_path_index))
+            pipe.hincrby(current_state_key, "node_count", increment)
+            pipe.publish("smartfarm:robot", message)
+            new_count = pipe.execute()[-2]
+        print(f"[Remove] Robot {robot_id}: node_count +{increment} ({nodes_traversed} node(s) × {unit}, total: {new_count})")
 
     def _handle_error(self, map_name: str, robot_id: str, payload: str) -> None:
         """로봇 에러 처리 - 상태를 ERROR로 변경하고 Redis로 에러 정보 publish"""
@@ -195,9 +244,9 @@ class CommandHandler(MQTTHandler):
         robot_state_service.update_status(map_name, robot_id, RobotStatus.ERROR)
 
         # Redis로 에러 정보 publish
-        message = json.dumps({
+        message = _dumps({
             "type": "ERROR",
-            "payload": json.loads(payload)
+            "payload": _loads(payload)
         })
         redis_service.publish("smartfarm:robot", message)
         print(f"[Error] Robot {robot_id}: {payload}")
@@ -4,8 +4,10 @@ from datetime import datetime
 from typing import Optional
 
 from app.util.mqtt.handler import MQTTHandler
+from app.util.mqtt.workers import mqtt_workers
 from app.util.redis.client import redis_service
 from app.domain.robot.daily_stats_service import daily_stats_service
+from app.domain.robot.robot_state_service import robot_state_service
 from app.domain.robot.robot_states import RobotOperationState
 
 
@@ -92,14 +94,16 @@ class ConnectionHandler(MQTTHandler):
         now = datetime.now().isoformat()
         key = self._get_connection_key(parsed["device_name"], parsed["map_name"], parsed["device_id"])
 
-        # 연결 정보 저장
-        redis_service.hset(key, "status", "connected")
-        redis_service.hset(key, "connected_at", now)
-        redis_service.hset(key, "ip", ip_address)
-        redis_service.hset(key, "device_name", parsed["device_name"])
-        redis_service.hset(key, "device_id", parsed["device_id"])
-        redis_service.hset(key, "map_name", parsed["map_name"])
-        redis_service.hset(key, "uuid", parsed["uuid"])
+        # 연결 정보 저장 (한 번의 HSET)
+        redis_service.hset_mapping(key, {
+            "status": "connected",
+            "connected_at": now,
+            "ip": ip_address,
+            "device_name": parsed["device_name"],
+            "device_id": parsed["device_id"],
+            "map_name": parsed["map_name"],
+            "uuid": parsed["uuid"],
+        })
 
         print(f"[Connection] ✅ Connected - {parsed['device_name']}({parsed['map_name']}:{parsed['device_id']}), IP: {ip_address}")
 
@@ -128,9 +132,13 @@ class ConnectionHandler(MQTTHandler):
         print(f"[Connection] ❌ Disconnected - {device_name}({map_name}:{device_id}), Reason: {reason}")
 
         if device_name == "robot":
-            robot_state_key = f"robot:state:{map_name}:{device_id}"
-            redis_service.delete(robot_state_key)
-            daily_stats_service.start_state(map_name, device_id, RobotOperationState.IDLE)
-            print(f"[Connection] Robot {device_id} ({map_name}): state reset to IDLE, robot:state key deleted")
+            # 명령과 같은 샤드 키로 예약해 이 로봇의 앞선 명령이 모두 처리된 뒤 초기화
+            mqtt_workers.submit(f"{map_name}/{device_id}", self._reset_robot, map_name, device_id)
         elif device_name == "jetson":
             pass  # TODO: jetson disconnect 처리
+
+    def _reset_robot(self, map_name: str, robot_id: str) -> None:
+        """로봇 연결 해제 시 상태 키 삭제 + 가동률 상태 IDLE 전환 (워커 스레드에서 실행)"""
+        robot_state_service.delete_robot_state(map_name, robot_id)
+        daily_stats_service.start_state(map_name, robot_id, RobotOperationState.IDLE)
+        print(f"[Connection] Robot {robot_id} ({map_name}): state reset to IDLE, robot:state key deleted")
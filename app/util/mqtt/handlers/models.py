@@ -1,26 +1,36 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-class PathPayload(BaseModel):
+class MQTTPayload(BaseModel):
+    """MQTT 명령 payload 공통 베이스
+
+    핸들러에서는 Model.model_validate_json(payload)로 JSON 문자열을 dict 없이 바로 검증하고,
+    검증된 payload는 읽기 전용으로만 사용합니다.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class PathPayload(MQTTPayload):
     current_node: int  # 현재 노드 ID
     final_node: int    # 목적지 노드 ID (0이면 복귀 시그널)
 
 
-class BatteryPayload(BaseModel):
+class BatteryPayload(MQTTPayload):
     battery_state: str  # 배터리 잔량 (%)
     battery_charging_state: int  # 충전 상태 (0: 미충전, 1: 충전중)
     robot_id: int
     map_name: str
 
 
-class ArrivePayload(BaseModel):
+class ArrivePayload(MQTTPayload):
     current_node: int  # 도착 노드 ID
 
 
-class RemovePathPayload(BaseModel):
+class RemovePathPayload(MQTTPayload):
     current_node: int  # 해제할 노드 ID
 
 
-class NextPayload(BaseModel):
+class NextPayload(MQTTPayload):
     current_node: int  # 현재 노드 ID
     direction: str     # 진행 방향 (l, r, u, d)
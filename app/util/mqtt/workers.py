@@ -0,0 +1,110 @@
+"""MQTT 메시지 처리 워커 - paho 네트워크 스레드에서 Redis/BFS 처리를 분리"""
+import queue
+import threading
+from typing import Callable
+
+from app.config.settings import settings
+from app.util.log import get_logger
+
+logger = get_logger("mqtt")
+
+# 워커 종료 신호
+_STOP = object()
+
+
+class ShardedWorkers:
+    """샤드 키별로 순서를 보장하는 워커 스레드 묶음
+
+    같은 샤드 키(예: 맵/로봇)의 작업은 항상 같은 워커에서 순서대로 처리되고,
+    다른 로봇의 작업은 여러 워커에서 병렬로 처리됩니다.
+    워커마다 큐 크기가 제한되어 있고, 큐가 가득 차면:
+    - droppable 작업 (새 메시지가 대체하는 배터리 등): 대기하지 않고 바로 버림
+    - 그 외 상태 변경 작업: put_timeout초까지만 대기 (paho 네트워크 스레드가 무한정 막히지 않도록)
+    버린 작업 수는 dropped에 누적됩니다.
+    시작 전(또는 종료 후)에는 submit한 작업을 호출 스레드에서 바로 실행합니다.
+    """
+
+    def __init__(self, worker_count: int, queue_size: int, put_timeout: float):
+        self.worker_count = worker_count
+        self.queue_size = queue_size
+        self.put_timeout = put_timeout
+        self._queues: list[queue.Queue] = []
+        self._threads: list[threading.Thread] = []
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    def start(self):
+        """워커 스레드 시작"""
+        if self.running:
+            return
+
+        self._queues = [queue.Queue(maxsize=self.queue_size) for _ in range(self.worker_count)]
+        self._threads = [
+            threading.Thread(target=self._run, args=(q,), name=f"mqtt-worker-{i}", daemon=True)
+            for i, q in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """워커 스레드 종료 (큐에 남은 작업은 모두 처리한 뒤 종료)"""
+        if not self.running:
+            return
+
+        for q in self._queues:
+            q.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._queues = []
+        self._threads = []
+
+    def submit(self, shard_key: str, func: Callable, *args, droppable: bool = False) -> None:
+        """작업 예약
+
+        Args:
+            shard_key: 순서를 보장할 단위 (같은 키는 같은 워커에서 순서대로 실행)
+            func: 실행할 함수
+            *args: 함수 인자
+            droppable: 큐가 가득 차면 바로 버려도 되는 작업 여부 (새 메시지가 대체하는 갱신)
+        """
+        queues = self._queues
+        if not queues:
+            self._call(func, args)
+            return
+
+        q = queues[hash(shard_key) % len(queues)]
+        try:
+            if droppable:
+                q.put_nowait((func, args))
+            else:
+                q.put((func, args), timeout=self.put_timeout)
+        except queue.Full:
+            self.dropped += 1
+            log = logger.warning if droppable else logger.error
+            log(
+                "[MQTT] Worker queue full, dropping %s for %s (dropped: %d)",
+                getattr(func, "__name__", func), shard_key, self.dropped,
+            )
+
+    def _run(self, q: queue.Queue):
+        while True:
+            item = q.get()
+            if item is _STOP:
+                return
+            func, args = item
+            self._call(func, args)
+
+    def _call(self, func: Callable, args: tuple):
+        # 작업 하나의 예외로 워커 스레드가 죽지 않도록 로그만 남김
+        try:
+            func(*args)
+        except Exception:
+            logger.exception("[MQTT] Worker task failed: %s", getattr(func, "__name__", func))
+
+
+mqtt_workers = ShardedWorkers(
+    settings.mqtt.worker_count, settings.mqtt.worker_queue_size, settings.mqtt.worker_put_timeout
+)
@@ -1,9 +1,14 @@
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
+import asyncio
 import threading
 
 import redis
+import redis.asyncio as aioredis
 
 from app.config.settings import settings
+from app.util.log import get_logger
+
+logger = get_logger("redis")
 
 
 class RedisService:
@@ -11,19 +16,51 @@ class RedisService:
         self.host = settings.redis.host
         self.port = settings.redis.port
         self.db = settings.redis.db
+        self.max_connections = settings.redis.max_connections
+        self.health_check_interval = settings.redis.health_check_interval
+        self.pool_timeout = settings.redis.pool_timeout
+        self.pool: redis.BlockingConnectionPool = None
         self.client: redis.Redis = None
         self.pubsub: redis.client.PubSub = None
         self.pubsub_thread: threading.Thread = None
+        # FastAPI 핸들러(이벤트 루프)용 비동기 클라이언트
+        self.async_pool: aioredis.BlockingConnectionPool = None
+        self.async_client: aioredis.Redis = None
+        self._pending_publishes: set[asyncio.Task] = set()  # publish_nowait 태스크 참조 유지 (GC 방지)
 
     def connect(self):
         try:
-            self.client = redis.Redis(host=self.host, port=self.port, db=self.db, decode_responses=True)
+            # 커넥션 풀을 한 번만 만들어 모든 명령에서 재사용
+            # (연결이 모두 사용 중이면 바로 에러 대신 pool_timeout초까지 반납을 기다림)
+            self.pool = redis.BlockingConnectionPool(**self._pool_kwargs())
+            self.client = redis.Redis(connection_pool=self.pool)
             self.client.ping()
+
+            # 비동기 클라이언트도 풀 하나를 공유 (실제 연결은 첫 명령 시 이벤트 루프에서 생성)
+            self.async_pool = aioredis.BlockingConnectionPool(**self._pool_kwargs())
+            self.async_client = aioredis.Redis(connection_pool=self.async_pool)
             print("Redis 연결 성공")
         except Exception as e:
             print(f"Redis 연결 실패: {e}")
             self.client = None
 
+    def _pool_kwargs(self) -> dict:
+        """동기/비동기 커넥션 풀 공통 설정
+
+        keepalive + 주기적 health check로 끊어진 유휴 연결을 명령 실행 전에 감지하여
+        요청 도중 재연결이 일어나지 않도록 합니다.
+        """
+        return {
+            "host": self.host,
+            "port": self.port,
+            "db": self.db,
+            "decode_responses": True,
+            "max_connections": self.max_connections,
+            "timeout": self.pool_timeout,
+            "socket_keepalive": True,
+            "health_check_interval": self.health_check_interval,
+        }
+
     def disconnect(self):
         # Pub/Sub 스레드 먼저 중지
         if self.pubsub_thread:
@@ -35,9 +72,23 @@ class RedisService:
             self.pubsub.unsubscribe()
             self.pubsub.close()
 
-        # Redis 클라이언트 종료
+        # Redis 클라이언트 및 커넥션 풀 종료
         if self.client:
             self.client.close()
+        if self.pool:
+            self.pool.disconnect()
+
+    async def aclose(self):
+        """비동기 클라이언트 및 커넥션 풀 종료 (이벤트 루프 안에서 호출)"""
+        # 아직 전송 중인 publish_nowait 메시지 마무리
+        if self._pending_publishes:
+            await asyncio.gather(*self._pending_publishes, return_exceptions=True)
+
+        if self.async_client:
+            await self.async_client.close()
+            await self.async_pool.disconnect()
+            self.async_client = None
+            self.async_pool = None
 
     def is_connected(self) -> bool:
         if not self.client:
@@ -60,6 +111,12 @@ class RedisService:
             return True
         return False
 
+    def exists(self, key: str) -> bool:
+        """키 존재 여부 (내용을 읽지 않고 EXISTS로 확인)"""
+        if self.client:
+            return self.client.exists(key) > 0
+        return False
+
     def delete(self, key: str) -> bool:
         if self.client:
             self.client.delete(key)
@@ -72,12 +129,33 @@ class RedisService:
             return self.client.hget(name, key)
         return None
 
+    def hmget(self, name: str, *keys: str) -> list[Optional[str]]:
+        """여러 Hash 필드를 한 번의 HMGET으로 조회 (미연결 시 모두 None)"""
+        if self.client:
+            return self.client.hmget(name, keys)
+        return [None] * len(keys)
+
     def hset(self, name: str, key: str, value: str) -> bool:
         if self.client:
             self.client.hset(name, key, value)
             return True
         return False
 
+    def hset_mapping(self, name: str, mapping: dict) -> bool:
+        """여러 Hash 필드를 한 번의 HSET 명령으로 저장
+
+        Args:
+            name: Hash 키
+            mapping: {필드: 값} 딕셔너리
+
+        Returns:
+            성공 여부
+        """
+        if self.client:
+            self.client.hset(name, mapping=mapping)
+            return True
+        return False
+
     def hgetall(self, name: str) -> dict:
         if self.client:
             return self.client.hgetall(name)
@@ -89,6 +167,51 @@ class RedisService:
             return True
         return False
 
+    def sadd(self, name: str, *values: str) -> bool:
+        if self.client:
+            self.client.sadd(name, *values)
+            return True
+        return False
+
+    def hincrbyfloat(self, name: str, key: str, amount: float) -> Optional[float]:
+        """Hash 필드 값을 원자적으로 증가 (없으면 0에서 시작)"""
+        if self.client:
+            return self.client.hincrbyfloat(name, key, amount)
+        return None
+
+    def pipeline(self, transaction: bool = False) -> Optional[redis.client.Pipeline]:
+        """여러 명령을 한 번의 왕복으로 보내는 파이프라인 반환 (미연결 시 None)
+
+        Args:
+            transaction: True면 MULTI/EXEC로 감싸서 실행
+        """
+        if self.client:
+            return self.client.pipeline(transaction=transaction)
+        return None
+
+    def apipeline(self, transaction: bool = False) -> Optional[aioredis.client.Pipeline]:
+        """비동기 파이프라인 반환 (FastAPI 핸들러용, 미연결 시 None)
+
+        Args:
+            transaction: True면 MULTI/EXEC로 감싸서 실행
+        """
+        if self.async_client:
+            return self.async_client.pipeline(transaction=transaction)
+        return None
+
+    def register_script(self, script: str) -> Optional["redis.commands.core.Script"]:
+        """Lua 스크립트 등록 (호출 시 EVALSHA, 캐시에 없으면 자동으로 SCRIPT LOAD)
+
+        Args:
+            script: Lua 스크립트 소스
+
+        Returns:
+            호출 가능한 Script 객체 (미연결 시 None)
+        """
+        if self.client:
+            return self.client.register_script(script)
+        return None
+
     def expire(self, key: str, seconds: int) -> bool:
         if self.client:
             self.client.expire(key, seconds)
@@ -96,22 +219,65 @@ class RedisService:
         return False
 
     # Pub/Sub 기능
-    def publish(self, channel: str, message: str) -> bool:
+    def publish(self, channel: str, message: Union[str, bytes]) -> bool:
         """Redis 채널에 메시지 발행
 
         Args:
             channel: 채널 이름
-            message: 발행할 메시지
+            message: 발행할 메시지 (str 또는 직렬화된 bytes)
 
         Returns:
             성공 여부
         """
         if self.client:
             self.client.publish(channel, message)
-            print(f"Redis 채널에 메시지 발행: {channel} -> {message}")
+            logger.debug("Redis 채널에 메시지 발행: %s -> %s", channel, message)
+            return True
+        return False
+
+    async def apublish(self, channel: str, message: Union[str, bytes]) -> bool:
+        """Redis 채널에 메시지 발행 (비동기 - FastAPI 핸들러용)
+
+        Args:
+            channel: 채널 이름
+            message: 발행할 메시지 (str 또는 직렬화된 bytes)
+
+        Returns:
+            성공 여부
+        """
+        if self.async_client:
+            await self.async_client.publish(channel, message)
+            logger.debug("Redis 채널에 메시지 발행: %s -> %s", channel, message)
             return True
         return False
 
+    def publish_nowait(self, channel: str, message: Union[str, bytes]) -> bool:
+        """Redis 채널에 메시지 발행 (응답을 기다리지 않음 - 이벤트 루프 안에서 호출)
+
+        PUBLISH 명령을 태스크로 예약만 하고 바로 반환합니다.
+        전송 실패는 로그로만 남습니다.
+
+        Args:
+            channel: 채널 이름
+            message: 발행할 메시지 (str 또는 직렬화된 bytes)
+
+        Returns:
+            예약 성공 여부
+        """
+        if not self.async_client:
+            return False
+
+        task = asyncio.create_task(self.apublish(channel, message))
+        self._pending_publishes.add(task)
+        task.add_done_callback(self._on_publish_done)
+        return True
+
+    def _on_publish_done(self, task: asyncio.Task) -> None:
+        """publish_nowait 태스크 완료 처리"""
+        self._pending_publishes.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"Redis 채널 메시지 발행 실패: {task.exception()}")
+
     def subscribe(self, channel: str, handler: Callable[[str], None]) -> bool:
         """Redis 채널 구독 (별도 스레드에서 실행)
 
@@ -134,7 +300,7 @@ class RedisService:
             def make_callback(ch, h):
                 def callback(msg):
                     if msg['type'] == 'message':
-                        print(f"[Redis] Received on channel '{ch}': {msg['data']}")
+                        logger.debug("[Redis] Received on channel '%s': %s", ch, msg['data'])
                         h(msg['data'])
                 return callback
             self.pubsub.subscribe(**{channel: make_callback(channel, handler)})
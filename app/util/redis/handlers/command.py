@@ -42,13 +42,13 @@ class RedisCommandHandler:
 
     def _handle_start_command(self, map_name: str, robot_id: str) -> None:
         """Start 명령 처리 - 현재 노드의 왼쪽(l) 방향으로 이동"""
-        robot_state = robot_state_service.get_robot_state(map_name, robot_id)
+        robot_fields = robot_state_service.get_robot_operation_fields(map_name, robot_id)
 
-        if not robot_state or "current_node" not in robot_state:
+        if robot_fields is None:
             print(f"[Redis] Robot {robot_id} state not found or missing current_node")
             return
 
-        current_node = robot_state["current_node"]
+        current_node = robot_fields[0]
 
         node_data = get_node(map_name, current_node)
         if not node_data:
@@ -72,13 +72,13 @@ class RedisCommandHandler:
 
     def _handle_next_command(self, map_name: str, robot_id: str) -> None:
         """Next 명령 처리 - l 방향 다음 노드로 전진"""
-        robot_state = robot_state_service.get_robot_state(map_name, robot_id)
+        robot_fields = robot_state_service.get_robot_operation_fields(map_name, robot_id)
 
-        if not robot_state or "current_node" not in robot_state:
+        if robot_fields is None:
             print(f"[Redis] Robot {robot_id} state not found")
             return
 
-        current_node = robot_state["current_node"]
+        current_node = robot_fields[0]
 
         node_data = get_node(map_name, current_node)
         if not node_data:
@@ -104,13 +104,13 @@ class RedisCommandHandler:
 
     def _handle_return_command(self, map_name: str, robot_id: str) -> None:
         """Return 명령 처리 - 로봇 상태를 RETURN으로 변경하고 복귀 노드 전송"""
-        robot_state = robot_state_service.get_robot_state(map_name, robot_id)
+        robot_fields = robot_state_service.get_robot_operation_fields(map_name, robot_id)
 
-        if not robot_state or "current_node" not in robot_state:
+        if robot_fields is None:
             print(f"[Redis] Robot {robot_id} state not found or missing current_node")
             return
 
-        current_node = robot_state["current_node"]
+        current_node = robot_fields[0]
         final_node = 0  # 로봇에 무조건 복귀하도록 하는 노드
 
         robot_state_service.update_position(map_name, robot_id, current_node, final_node)
@@ -1,7 +1,12 @@
 import json
+import time
 
 from app.util.redis.client import redis_service
 
+# get_all_nodes 결과 캐시 (한 요청 내 중복 HGETALL 방지용, 짧은 TTL)
+_NODES_CACHE_TTL = 0.05  # 초
+_nodes_cache: dict[str, tuple[float, dict, list, int]] = {}  # {map_name: (저장 시각, 노드 데이터, 인접 리스트, 스냅샷 해시)}
+
 
 def _get_nodes_key(map_name: str) -> str:
     """맵별 노드 키 생성
@@ -15,6 +20,15 @@ def _get_nodes_key(map_name: str) -> str:
     return f"nodes:{map_name}"
 
 
+def invalidate_nodes_cache(map_name: str) -> None:
+    """맵의 노드 캐시 무효화 (노드 데이터 변경 시 호출, 파이프라인으로 변경했다면 execute() 후 호출)
+
+    Args:
+        map_name: 맵 이름
+    """
+    _nodes_cache.pop(map_name, None)
+
+
 def init_node_data(map_name: str = "default"):
     """노드 초기 데이터 생성 (맵별)
 
@@ -26,9 +40,8 @@ def init_node_data(map_name: str = "default"):
 
     nodes_key = _get_nodes_key(map_name)
 
-    # 기존 데이터 확인
-    existing = redis_service.hgetall(nodes_key)
-    if existing:
+    # 기존 데이터 확인 (노드 전체를 읽지 않고 키 존재만 확인)
+    if redis_service.exists(nodes_key):
         print(f"[Init] Nodes already exist for map: {map_name}")
         return
 
@@ -53,6 +66,7 @@ def init_node_data(map_name: str = "default"):
             }
         redis_service.hset(nodes_key, str(node_id), json.dumps(node_data))
 
+    invalidate_nodes_cache(map_name)
     print(f"[Init] Created 166 nodes for map: {map_name}")
 
 
@@ -73,8 +87,7 @@ def init_testbed_node_data(map_name: str = "smartfarm_testbed"):
 
     nodes_key = _get_nodes_key(map_name)
 
-    existing = redis_service.hgetall(nodes_key)
-    if existing:
+    if redis_service.exists(nodes_key):
         print(f"[Init] Nodes already exist for map: {map_name}")
         return
 
@@ -97,21 +110,80 @@ def init_testbed_node_data(map_name: str = "smartfarm_testbed"):
     for node_id, node_data in nodes.items():
         redis_service.hset(nodes_key, str(node_id), json.dumps(node_data))
 
+    invalidate_nodes_cache(map_name)
     print(f"[Init] Created {len(nodes)} nodes for map: {map_name}")
 
 
-def get_all_nodes(map_name: str = "default") -> dict:
-    """모든 노드 데이터 조회 (맵별)
+def build_adjacency(nodes: dict) -> list[tuple]:
+    """노드 ID로 바로 인덱싱되는 인접 리스트 생성 (BFS용)
+
+    각 노드에 node["_adj"] = ((방향, 이웃 노드), ...)와
+    node["_dir"] = {이웃 노드: 방향} (경로 복원 시 방향 조회용, 같은 이웃이면 l, r, u, d 순서상 앞선 방향),
+    node["_rev"] = ((이전 노드, 방향), ...) (이 노드로 들어오는 연결, 양방향 BFS의 역방향 탐색용)을 채우고,
+    _adj와 같은 튜플을 노드 ID 위치에 담은 리스트를 반환합니다.
+    연결 없는 방향(0)과 맵에 없는 이웃은 미리 제외합니다.
+
+    Args:
+        nodes: {node_id: node_data} 딕셔너리
+
+    Returns:
+        adjacency[node_id] = ((방향, 이웃 노드), ...) 리스트 (없는 ID는 빈 튜플)
+    """
+    adjacency = [()] * (max(nodes, default=0) + 1)
+    for node_id, node in nodes.items():
+        node["_adj"] = tuple(
+            (d, node[d]) for d in ("l", "r", "u", "d") if node[d] != 0 and node[d] in nodes
+        )
+        node["_dir"] = {neighbor: d for d, neighbor in reversed(node["_adj"])}
+        adjacency[node_id] = node["_adj"]
+
+    # 역방향 인접 리스트 (단방향 연결이 있어 _adj를 뒤집어 따로 구성)
+    reverse = {}
+    for node_id, node in nodes.items():
+        for d, neighbor in node["_adj"]:
+            reverse.setdefault(neighbor, []).append((node_id, d))
+    for node_id, node in nodes.items():
+        node["_rev"] = tuple(reverse.get(node_id, ()))
+    return adjacency
+
+
+def get_node_graph(map_name: str = "default") -> tuple[dict, list[tuple], int]:
+    """노드 데이터와 인접 리스트를 함께 조회 (같은 스냅샷, 짧은 TTL 캐시)
 
     Args:
         map_name: 맵 이름 (기본값: "default")
 
     Returns:
-        {node_id: node_data} 딕셔너리
+        ({node_id: node_data}, build_adjacency 결과, 스냅샷 해시) - 캐시된 값을 공유하므로 수정 금지
+        스냅샷 해시는 연결/점유 상태가 같으면 같은 값이므로 경로 계산 결과 캐시 키로 사용
     """
+    now = time.monotonic()
+    cached = _nodes_cache.get(map_name)
+    if cached and now - cached[0] < _NODES_CACHE_TTL:
+        return cached[1], cached[2], cached[3]
+
     nodes_key = _get_nodes_key(map_name)
     raw_data = redis_service.hgetall(nodes_key)
-    return {int(k): json.loads(v) for k, v in raw_data.items()}
+    nodes = {int(k): json.loads(v) for k, v in raw_data.items()}
+    adjacency = build_adjacency(nodes)
+    snapshot_hash = hash(frozenset(raw_data.items()))
+
+    _nodes_cache[map_name] = (now, nodes, adjacency, snapshot_hash)
+    return nodes, adjacency, snapshot_hash
+
+
+def get_all_nodes(map_name: str = "default") -> dict:
+    """모든 노드 데이터 조회 (맵별)
+
+    Args:
+        map_name: 맵 이름 (기본값: "default")
+
+    Returns:
+        {node_id: node_data} 딕셔너리 (짧은 TTL 동안 캐시된 값을 공유하므로 수정 금지)
+        node_data["_adj"]에는 ((방향, 이웃 노드), ...) 튜플, node_data["_dir"]에는 {이웃 노드: 방향},
+        node_data["_rev"]에는 ((이전 노드, 방향), ...) 튜플이 미리 계산되어 있음
+    """
+    return get_node_graph(map_name)[0]
 
 
 def get_node(map_name: str, node_id: int) -> dict:
@@ -139,6 +211,7 @@ def clear_nodes(map_name: str = "default"):
     """
     nodes_key = _get_nodes_key(map_name)
     redis_service.delete(nodes_key)
+    invalidate_nodes_cache(map_name)
 
 
 def occupy_node(map_name: str, node_id: int, robot_id: str) -> bool:
@@ -162,6 +235,7 @@ def occupy_node(map_name: str, node_id: int, robot_id: str) -> bool:
     node["occupied"] = robot_id
     nodes_key = _get_nodes_key(map_name)
     redis_service.hset(nodes_key, str(node_id), json.dumps(node))
+    invalidate_nodes_cache(map_name)
     return True
 
 
@@ -187,6 +261,7 @@ def release_node(map_name: str, node_id: int, robot_id: str = None) -> bool:
     node["occupied"] = None
     nodes_key = _get_nodes_key(map_name)
     redis_service.hset(nodes_key, str(node_id), json.dumps(node))
+    invalidate_nodes_cache(map_name)
     return True
 
 
@@ -207,24 +282,36 @@ def get_occupied_nodes(map_name: str = "default") -> dict[int, str]:
     }
 
 
-def release_robot_nodes(map_name: str, robot_id: str) -> int:
+def release_robot_nodes(map_name: str, robot_id: str, pipe=None) -> int:
     """특정 로봇이 점유한 모든 노드 해제 (맵별)
 
     Args:
         map_name: 맵 이름
         robot_id: 로봇 ID
+        pipe: 함께 실행할 파이프라인 (넘기면 HSET을 추가만 하고, 실행 후 노드 캐시 무효화까지 호출 측에서 처리)
 
     Returns:
         해제된 노드 수
     """
     all_nodes = get_all_nodes(map_name)
-    released_count = 0
-    nodes_key = _get_nodes_key(map_name)
+    released_nodes = {}
 
     for node_id, node in all_nodes.items():
         if node.get("occupied") == robot_id:
-            node["occupied"] = None
-            redis_service.hset(nodes_key, str(node_id), json.dumps(node))
-            released_count += 1
+            released = {k: v for k, v in node.items() if k not in ("_adj", "_dir", "_rev")}
+            released["occupied"] = None
+            released_nodes[str(node_id)] = json.dumps(released)
+
+    if not released_nodes:
+        return 0
 
-    return released_count
+    # 해제할 노드를 한 번의 HSET으로 저장
+    nodes_key = _get_nodes_key(map_name)
+    if pipe is not None:
+        # 캐시는 쓰기가 반영된 뒤에 무효화해야 하므로 호출 측에서 execute() 후 invalidate_nodes_cache 호출
+        pipe.hset(nodes_key, mapping=released_nodes)
+    else:
+        redis_service.hset_mapping(nodes_key, released_nodes)
+        invalidate_nodes_cache(map_name)
+
+    return len(released_nodes)
@@ -0,0 +1,99 @@
+"""로봇 상태 발행 병합기 - 짧은 주기 동안 채널별 마지막 상태만 모아 한 번에 발행"""
+import threading
+
+import orjson
+
+from app.config.settings import settings
+from app.util.log import get_logger
+from app.util.redis.client import redis_service
+
+logger = get_logger("redis")
+
+
+class StatePublishCoalescer:
+    """상태 스냅샷 Pub/Sub 발행을 flush 주기마다 묶어서 전송 (latest-wins)
+
+    상태 채널은 로봇마다 하나이고 메시지는 전체 상태 스냅샷이므로,
+    주기 안에서 같은 채널에 여러 번 발행되면 마지막 상태만 보내도 됩니다.
+    flush_interval_ms가 0이면 비활성화 (호출 측에서 바로 발행).
+    예약된 채널이 max_batch개에 도달하면 주기를 기다리지 않고 바로 flush합니다.
+    """
+
+    def __init__(self, flush_interval_ms: int, max_batch: int = 100):
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max_batch
+        self._pending: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread: threading.Thread = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.flush_interval > 0
+
+    def start(self):
+        """flush 스레드 시작 (비활성화 상태면 아무것도 하지 않음)"""
+        if not self.enabled or (self._thread and self._thread.is_alive()):
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="state-publish-coalescer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """flush 스레드 종료 (남은 상태는 마지막으로 한 번 발행)"""
+        if not self._thread:
+            return
+
+        self._stop_event.set()
+        self._wake_event.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        self.flush()
+
+    def publish_state(self, channel: str, state: dict) -> None:
+        """상태 발행 예약 (같은 채널의 이전 예약 상태는 덮어씀)
+
+        Args:
+            channel: 상태 채널
+            state: 발행할 로봇 상태 (직렬화는 flush 시점에 한 번만 수행)
+        """
+        with self._lock:
+            self._pending[channel] = state
+            pending_count = len(self._pending)
+
+        if pending_count >= self.max_batch:
+            self._wake_event.set()
+
+    def flush(self) -> None:
+        """예약된 상태를 하나의 파이프라인으로 발행"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        pipe = redis_service.pipeline()
+        if pipe is None:
+            return
+
+        try:
+            with pipe:
+                for channel, state in pending.items():
+                    pipe.publish(channel, orjson.dumps(state))
+                pipe.execute()
+        except Exception as e:
+            logger.warning("[Redis] Failed to flush %d state publishes: %s", len(pending), e)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            # flush 주기마다, 또는 max_batch 도달 시 바로 깨어나서 발행
+            self._wake_event.wait(self.flush_interval)
+            self._wake_event.clear()
+            self.flush()
+
+
+state_publish_coalescer = StatePublishCoalescer(
+    settings.redis.state_publish_interval_ms,
+    settings.redis.state_publish_max_batch,
+)
@@ -51,17 +51,20 @@ class DailyResetScheduler:
                 map_name = parts[2]
                 robot_id = parts[3]
 
-                # 현재 상태 조회
-                current_state_data = redis_service.hgetall(key)
-                if not current_state_data or "state" not in current_state_data:
+                # 현재 상태 조회 (state 필드만)
+                state_value = redis_service.hget(key, "state")
+                if not state_value:
                     continue
 
-                state = RobotOperationState(current_state_data["state"])
+                state = RobotOperationState(state_value)
 
                 # 현재 상태를 종료하고 즉시 재시작
                 # (start_state가 자동으로 이전 상태 종료 처리)
                 daily_stats_service.start_state(map_name, robot_id, state, datetime.now())
 
+                # 보관 기간이 지난 날짜별 통계 필드 정리
+                daily_stats_service.prune_old_stats(map_name, robot_id)
+
                 reset_count += 1
                 print(f"[Scheduler] Reset {map_name}/{robot_id}: {state.value}")
 
@@ -7,12 +7,17 @@ from app.domain.health import router as health_router
 from app.domain.path import router as path_router
 from app.domain.redis_command import router as redis_command_router
 from app.domain.robot import router as robot_router
+from app.domain.robot.daily_stats_service import daily_stats_service
+from app.domain.robot.robot_state_service import robot_state_service
 from app.util.mqtt.client import mqtt_service
 from app.util.mqtt.handlers import CommandHandler, ConnectionHandler
+from app.util.mqtt.workers import mqtt_workers
 from app.util.redis.client import redis_service
 from app.util.redis.init_data import init_node_data, init_testbed_node_data
 from app.util.redis.handlers.command import redis_command_handler
+from app.util.redis.publisher import state_publish_coalescer
 from app.util.scheduler import daily_reset_scheduler
+from app.util.log import queue_logging
 
 
 def register_mqtt_handlers():
@@ -29,6 +34,12 @@ def register_redis_handlers():
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 로그 출력은 백그라운드 스레드에서 처리
+    queue_logging.start()
+
+    # MQTT 명령 처리 워커 시작 (수신 스레드와 분리)
+    mqtt_workers.start()
+
     # MQTT 연결 및 핸들러 등록
     register_mqtt_handlers()
     mqtt_service.connect()
@@ -36,12 +47,21 @@ async def lifespan(app: FastAPI):
     # Redis 연결 및 핸들러 등록
     redis_service.connect()
 
+    # 이전 형식(날짜별 키) 가동률 통계를 로봇별 Hash로 이전 (이미 옮겨졌으면 아무것도 하지 않음)
+    daily_stats_service.migrate_legacy_stats()
+
+    # 맵별 로봇 인덱스 도입 전에 저장된 로봇 상태 키를 인덱스에 등록 (이미 등록됐으면 변화 없음)
+    robot_state_service.backfill_robot_index()
+
     # 맵 노드 초기화
     init_node_data("smartfarm_gangnam")
     init_testbed_node_data("smartfarm_testbed")
 
     register_redis_handlers()
 
+    # 로봇 상태 발행 병합 (REDIS_STATE_PUBLISH_INTERVAL_MS > 0 일 때만)
+    state_publish_coalescer.start()
+
     # 매일 00시 자동 초기화 스케줄러 시작
     daily_reset_scheduler.start()
 
@@ -50,7 +70,11 @@ async def lifespan(app: FastAPI):
     # 종료 시 연결 해제
     daily_reset_scheduler.stop()
     mqtt_service.disconnect()
+    mqtt_workers.stop()
+    state_publish_coalescer.stop()
     redis_service.disconnect()
+    await redis_service.aclose()
+    queue_logging.stop()
 
 
 app = FastAPI(